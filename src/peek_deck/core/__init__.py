@@ -3,7 +3,7 @@
 from .base_widget import BaseWidget, WidgetData
 from .cache import Cache
 from .config import PageConfig, WidgetConfig
-from .url_fetch_manager import URLFetchManager, get_url_fetch_manager
+from .url_fetch_manager import URLFetchManager, get_http_session, get_url_fetch_manager
 from .output_manager import OutputManager
 from .url_metadata import (
     URLMetadata,
@@ -20,6 +20,7 @@ __all__ = [
     "WidgetConfig",
     "URLFetchManager",
     "get_url_fetch_manager",
+    "get_http_session",
     "OutputManager",
     "URLMetadata",
     "URLMetadataExtractor",
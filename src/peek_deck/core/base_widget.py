@@ -2,11 +2,24 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 from jinja2 import Environment, FileSystemLoader
 
 
+@lru_cache(maxsize=None)
+def _get_jinja_env(templates_dir: str) -> Environment:
+    """Get the shared Jinja2 environment for a templates directory.
+
+    One environment per directory lets every widget instance reuse Jinja's
+    compiled-template cache instead of re-parsing templates per instance.
+    auto_reload is off because widget templates don't change during a run,
+    so cache hits skip the per-call template file stat.
+    """
+    return Environment(loader=FileSystemLoader(templates_dir), auto_reload=False)
+
+
 @dataclass
 class WidgetData:
     """Data returned by a widget after fetch/process/render."""
@@ -45,7 +58,7 @@ class BaseWidget(ABC):
         # Set up Jinja2 environment for widget templates
         project_root = Path.cwd()
         templates_dir = project_root / "templates"
-        self._jinja_env = Environment(loader=FileSystemLoader(templates_dir))
+        self._jinja_env = _get_jinja_env(str(templates_dir))
 
     @abstractmethod
     def fetch_data(self) -> Dict[str, Any]:
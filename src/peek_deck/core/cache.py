@@ -1,14 +1,44 @@
 """Cache system for tracking widget update times and data."""
 
-import json
 import hashlib
-from datetime import datetime, timezone, timedelta
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from threading import Lock
 from typing import Any, Dict, Optional
 
+from .fast_json import dumps, loads
 from .output_manager import OutputManager
 
+# Characters invalid in filenames on NTFS and other filesystems: " : < > | * ? \r \n
+_FILENAME_SANITIZE_TABLE = str.maketrans({char: '-' for char in ':"<>|*?\r\n'})
+
+# Param strings longer than this are replaced by a fixed-length hash
+_MAX_PARAM_STR_LENGTH = 100
+
+
+def _build_cache_key(category: str, page_id: str, widget_type: str, param_items: tuple) -> str:
+    """Build a cache key from sorted (key, type, value) param triples."""
+    base = f"{category}_{page_id}_{widget_type}"
+
+    # For long/complex params, use hash to keep filename short
+    param_str = "_".join(f"{k}={v}" for k, _, v in param_items)
+
+    # Sanitize filename in a single pass
+    param_str = param_str.translate(_FILENAME_SANITIZE_TABLE)
+
+    # If param string is too long, use a fixed-length hash instead
+    if len(param_str) > _MAX_PARAM_STR_LENGTH:
+        param_hash = hashlib.md5(param_str.encode()).hexdigest()[:12]
+        return f"{base}_{param_hash}"
+    else:
+        return f"{base}_{param_str}"
+
+
+# Same widgets are keyed repeatedly across fetch/process/render stages
+_memoized_cache_key = lru_cache(maxsize=4096)(_build_cache_key)
+
 
 class Cache:
     """Manages widget update timestamps and determines when widgets need refreshing.
@@ -21,6 +51,8 @@ class Cache:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file = self.cache_dir / "widget_timestamps.json"
         self.timestamps: Dict[str, str] = {}
+        # Parsed copy of timestamps as unix epoch seconds, to avoid re-parsing ISO strings
+        self._ts_epoch: Dict[str, float] = {}
         self._lock = Lock()
         self.load()
 
@@ -28,8 +60,7 @@ class Cache:
         """Load timestamps from disk."""
         if self.cache_file.exists():
             try:
-                with open(self.cache_file, 'r') as f:
-                    self.timestamps = json.load(f)
+                self.timestamps = loads(self.cache_file.read_bytes())
                 OutputManager.log(f"✅ Loaded {len(self.timestamps)} cached timestamps")
             except Exception as e:
                 OutputManager.log(f"⚠️  Failed to load cache: {e}")
@@ -37,46 +68,48 @@ class Cache:
         else:
             self.timestamps = {}
 
+        self._ts_epoch = {}
+        for key, value in self.timestamps.items():
+            try:
+                self._ts_epoch[key] = datetime.fromisoformat(value).timestamp()
+            except (TypeError, ValueError) as e:
+                OutputManager.log(f"⚠️  Invalid cached timestamp for {key}: {e}")
+
     def save(self):
         """Save timestamps to disk (thread-safe)."""
         with self._lock:
             try:
-                with open(self.cache_file, 'w') as f:
-                    json.dump(self.timestamps, f, indent=2)
+                # Compact output: this file is machine-read only
+                self.cache_file.write_bytes(dumps(self.timestamps, sort_keys=True))
                 OutputManager.log(f"💾 Saved {len(self.timestamps)} timestamps to cache")
             except Exception as e:
                 OutputManager.log(f"❌ Failed to save cache: {e}")
 
-    def get_cache_key(self, category: str, page_id: str, widget_type: str, widget_params: Dict[str, Any]) -> str:
+    @staticmethod
+    def get_cache_key(category: str, page_id: str, widget_type: str, widget_params: Dict[str, Any]) -> str:
         """Generate unique cache key for a widget instance.
 
         Includes category to prevent collisions when page IDs are reused across categories.
+        Keys for scalar-only params are memoized; params with list/dict values are
+        computed directly.
+
         Args:
             category: Page category (e.g., "crypto", "tech") - formerly series_id
             page_id: Page identifier
             widget_type: Widget type
             widget_params: Widget parameters
         """
-        base = f"{category}_{page_id}_{widget_type}"
-
         if not widget_params:
-            return base
-
-        # For long/complex params, use hash to keep filename short
-        param_str = "_".join(f"{k}={v}" for k, v in sorted(widget_params.items()))
-
-        # Sanitize filename - replace characters invalid on NTFS and other filesystems
-        # Invalid chars: " : < > | * ? \r \n
-        invalid_chars = [':', '"', '<', '>', '|', '*', '?', '\r', '\n']
-        for char in invalid_chars:
-            param_str = param_str.replace(char, '-')
+            return f"{category}_{page_id}_{widget_type}"
 
-        # If param string is too long (> 100 chars), use hash instead
-        if len(param_str) > 100:
-            param_hash = hashlib.md5(param_str.encode()).hexdigest()[:12]
-            return f"{base}_{param_hash}"
-        else:
-            return f"{base}_{param_str}"
+        # Value types are part of the memo key: True == 1 and 1 == 1.0, but they
+        # render differently in the key
+        param_items = tuple((k, type(v), v) for k, v in sorted(widget_params.items()))
+        try:
+            return _memoized_cache_key(category, page_id, widget_type, param_items)
+        except TypeError:
+            # Unhashable param values (e.g. a list of tab dicts)
+            return _build_cache_key(category, page_id, widget_type, param_items)
 
     def needs_update(self, cache_key: str, update_minutes: Optional[int]) -> bool:
         """Check if widget needs updating based on last update time (thread-safe)."""
@@ -85,38 +118,40 @@ class Cache:
             return True
 
         with self._lock:
-            if cache_key not in self.timestamps:
-                # Never updated before
-                return True
+            last_update = self._ts_epoch.get(cache_key)
 
-            try:
-                last_update = datetime.fromisoformat(self.timestamps[cache_key])
-                time_since_update = datetime.now(timezone.utc) - last_update
-                threshold = timedelta(minutes=update_minutes)
-                needs_update = time_since_update >= threshold
-
-                if needs_update:
-                    OutputManager.log(f"🔄 {cache_key}: Last updated {time_since_update.total_seconds() / 60:.1f}m ago (threshold: {update_minutes}m)")
-                else:
-                    remaining = (threshold - time_since_update).total_seconds() / 60
-                    OutputManager.log(f"⏭️  {cache_key}: Updated {time_since_update.total_seconds() / 60:.1f}m ago, skipping ({remaining:.1f}m remaining)")
-
-                return needs_update
-            except Exception as e:
-                OutputManager.log(f"⚠️  Error checking cache for {cache_key}: {e}")
-                return True  # Update on error
+        if last_update is None:
+            # Never updated before (or stored timestamp was unparseable)
+            return True
+
+        time_since_update = time.time() - last_update
+        threshold = update_minutes * 60
+        needs_update = time_since_update >= threshold
+
+        if needs_update:
+            OutputManager.log(
+                "🔄 %s: Last updated %.1fm ago (threshold: %sm)",
+                cache_key, time_since_update / 60, update_minutes,
+            )
+        else:
+            OutputManager.log(
+                "⏭️  %s: Updated %.1fm ago, skipping (%.1fm remaining)",
+                cache_key, time_since_update / 60, (threshold - time_since_update) / 60,
+            )
+
+        return needs_update
 
     def mark_updated(self, cache_key: str):
         """Mark widget as updated at current time (thread-safe)."""
+        now = time.time()
         with self._lock:
-            self.timestamps[cache_key] = datetime.now(timezone.utc).isoformat()
+            self.timestamps[cache_key] = datetime.fromtimestamp(now, timezone.utc).isoformat()
+            self._ts_epoch[cache_key] = now
 
     def get_last_update(self, cache_key: str) -> Optional[datetime]:
         """Get the last update time for a widget (thread-safe)."""
         with self._lock:
-            if cache_key in self.timestamps:
-                try:
-                    return datetime.fromisoformat(self.timestamps[cache_key])
-                except Exception:
-                    return None
+            last_update = self._ts_epoch.get(cache_key)
+        if last_update is None:
             return None
+        return datetime.fromtimestamp(last_update, timezone.utc)
@@ -0,0 +1,44 @@
+"""Fast JSON helpers backed by orjson when available.
+
+Falls back to the standard library json module if orjson is not installed,
+so callers never need to care which backend is in use.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+        sort_keys: Sort dictionary keys in output
+    """
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+    ).encode('utf-8')
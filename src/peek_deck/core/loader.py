@@ -1,10 +1,18 @@
 """Configuration and widget loading utilities."""
 
 import importlib
+import os
 import sys
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Type
+from threading import Lock
+from typing import Dict, List, Tuple, Type
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # LibYAML C parser
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 from .base_widget import BaseWidget
 from .config import PageConfig
@@ -17,14 +25,37 @@ from project_config import PACKAGE_NAME
 
 def load_yaml(file_path: Path) -> dict:
     """Load YAML file."""
-    with open(file_path, 'r') as f:
-        return yaml.safe_load(f)
+    with open(file_path, 'rb') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+# path -> (mtime_ns, size, PageConfig) for load_page_config
+_page_config_memo: Dict[str, Tuple[int, int, PageConfig]] = {}
+_page_config_lock = Lock()
 
 
 def load_page_config(page_file: Path) -> PageConfig:
-    """Load and validate page configuration."""
-    data = load_yaml(page_file)
-    return PageConfig(**data)
+    """Load and validate page configuration.
+
+    Loaded configs are memoized per file and reused until the file's mtime
+    or size changes, so the returned PageConfig is shared and must not be
+    mutated.
+
+    Args:
+        page_file: Path to the page YAML file
+    """
+    page_file = Path(page_file)
+    stat = page_file.stat()
+    memo_key = str(page_file)
+    with _page_config_lock:
+        memo = _page_config_memo.get(memo_key)
+    if memo is not None and memo[0] == stat.st_mtime_ns and memo[1] == stat.st_size:
+        return memo[2]
+
+    page_config = PageConfig(**yaml.load(page_file.read_bytes(), Loader=_YamlLoader))
+    with _page_config_lock:
+        _page_config_memo[memo_key] = (stat.st_mtime_ns, stat.st_size, page_config)
+    return page_config
 
 
 def discover_all_pages() -> List[Path]:
@@ -35,18 +66,26 @@ def discover_all_pages() -> List[Path]:
     if not pages_dir.exists():
         return []
 
-    # Find all .yaml files
-    page_files = [
-        f for f in pages_dir.glob("*.yaml")
-        if not f.stem.startswith("_")
-    ]
+    # Single directory scan; DirEntry caches the file-type check
+    with os.scandir(pages_dir) as entries:
+        page_files = [
+            pages_dir / entry.name
+            for entry in entries
+            if entry.name.endswith(".yaml")
+            and not entry.name.startswith(("_", "."))
+            and entry.is_file()
+        ]
 
     return sorted(page_files)
 
 
+@lru_cache(maxsize=None)
 def load_widget_class(widget_type: str) -> Type[BaseWidget]:
     """Dynamically load widget class by type.
 
+    Results are memoized per widget type; call load_widget_class.cache_clear()
+    to force re-resolution (e.g. after reloading a widget module).
+
     Args:
         widget_type: Widget type in kebab-case (e.g., "crypto-price")
 
@@ -60,14 +99,14 @@ def load_widget_class(widget_type: str) -> Type[BaseWidget]:
     # Convert kebab-case to snake_case for module name
     module_name = widget_type.replace("-", "_")
 
+    # Convert to PascalCase for class name
+    # e.g., "crypto_price" -> "CryptoPriceWidget"
+    class_name = "".join(word.capitalize() for word in module_name.split("_")) + "Widget"
+
     try:
         # Import the widget module (using centralized package name)
         module = importlib.import_module(f"{PACKAGE_NAME}.widgets.{module_name}")
 
-        # Convert to PascalCase for class name
-        # e.g., "crypto_price" -> "CryptoPriceWidget"
-        class_name = "".join(word.capitalize() for word in module_name.split("_")) + "Widget"
-
         # Get the class from the module
         widget_class = getattr(module, class_name)
 
@@ -0,0 +1,74 @@
+"""Bounded in-process cache with TTL and LRU eviction.
+
+Used for short-lived, per-run memoization where the persistent disk cache
+would be overkill (negative caches, parsed API responses, etc.).
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Generic, Hashable, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class MemoryCache(Generic[T]):
+    """Thread-safe in-memory cache with TTL and bounded size.
+
+    Features:
+    - Monotonic-clock TTL (robust to wall-clock jumps)
+    - LRU eviction once max_entries is reached
+    - Thread-safe for parallel widget fetching
+
+    Example:
+        cache = MemoryCache[dict](ttl_seconds=300, max_entries=256)
+        cache.set("key", {"value": 1})
+        value = cache.get("key")  # None if missing or expired
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        """Initialize memory cache.
+
+        Args:
+            ttl_seconds: Time-to-live for each entry in seconds
+            max_entries: Maximum number of entries (least recently used evicted first)
+        """
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_entries = max_entries
+        # Values are (value, monotonic expiry), ordered least recently used first
+        self._entries: "OrderedDict[Hashable, tuple[T, float]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """Get cached value if present and not expired, None otherwise."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expiry = entry
+            if time.monotonic() < expiry:
+                self._entries.move_to_end(key)
+                return value
+            # Expired, remove it
+            del self._entries[key]
+        return None
+
+    def set(self, key: Hashable, value: T):
+        """Store value with the cache TTL, evicting the oldest entries if full."""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
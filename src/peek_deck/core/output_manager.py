@@ -2,8 +2,12 @@
 
 Supports both direct printing (default) and output capture (for parallel execution).
 Uses thread-local storage so each thread can independently capture or print output.
+
+Messages accept lazy %-style arguments, and per-item progress lines go through
+debug(), which is a no-op unless PEEK_DECK_VERBOSE is set.
 """
 
+import os
 import threading
 from typing import List, Optional
 
@@ -23,9 +27,12 @@ class OutputManager:
 
         # In widgets/url_manager:
         OutputManager.log("✅ Fetched data")  # Automatically captured or printed
+        OutputManager.log("✅ Fetched %s: $%.2f", symbol, price)  # Lazy formatting
+        OutputManager.debug("   %d/%d: Resolved", i, total)  # Only when verbose
     """
 
     _local = threading.local()
+    verbose = os.environ.get("PEEK_DECK_VERBOSE", "").lower() not in ("", "0", "false", "no")
 
     @classmethod
     def set_capture(cls, enabled: bool = True):
@@ -40,15 +47,23 @@ class OutputManager:
             cls._local.output = None
 
     @classmethod
-    def log(cls, message: str, indent: int = 0):
+    def set_verbose(cls, enabled: bool = True):
+        """Enable or disable debug() output for all threads."""
+        cls.verbose = enabled
+
+    @classmethod
+    def log(cls, message: str, *args, indent: int = 0):
         """Log a message - either capture to list or print directly.
 
         Thread-safe: Uses thread-local storage, so each thread has its own output.
 
         Args:
-            message: Message to log
+            message: Message to log, optionally with %-style placeholders
+            *args: Values for the placeholders (formatted only when logged)
             indent: Number of spaces to indent (default: 0)
         """
+        if args:
+            message = message % args
         if indent > 0:
             message = " " * indent + message
 
@@ -58,6 +73,18 @@ class OutputManager:
         else:
             print(message)
 
+    @classmethod
+    def debug(cls, message: str, *args, indent: int = 0):
+        """Log a verbose-only message; skipped (and never formatted) otherwise.
+
+        Args:
+            message: Message to log, optionally with %-style placeholders
+            *args: Values for the placeholders
+            indent: Number of spaces to indent (default: 0)
+        """
+        if cls.verbose:
+            cls.log(message, *args, indent=indent)
+
     @classmethod
     def get_output(cls) -> List[str]:
         """Get captured output for current thread.
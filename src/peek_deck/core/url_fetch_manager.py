@@ -1,14 +1,50 @@
 """Centralized URL fetching with caching, rate limiting, and retry logic."""
 
 import hashlib
-import json
 import requests
 import time
-from datetime import datetime, timezone, timedelta
+from collections import OrderedDict
+from concurrent.futures import Future
 from threading import Lock, Semaphore
 from typing import Any, Dict, Optional, Literal
-from urllib.parse import urlparse
-from tenacity import retry, stop_after_attempt, wait_exponential, RetryError
+from urllib.parse import urlencode, urlparse
+
+from requests.adapters import HTTPAdapter
+
+from .fast_json import loads as json_loads
+
+
+class _CachedResponse:
+    """Raw response body plus lazily decoded (and memoized) representations."""
+
+    __slots__ = ("raw", "encoding", "_decoded")
+
+    def __init__(self, raw: bytes, encoding: Optional[str]):
+        self.raw = raw
+        self.encoding = encoding
+        self._decoded: Dict[str, Any] = {}
+
+    def decode(self, response_type: str) -> Any:
+        """Return the body as response_type, decoding at most once per type.
+
+        Decoded objects are shared by every caller served from this entry,
+        so treat them as read-only.
+        """
+        if response_type == "binary":
+            return self.raw
+
+        decoded = self._decoded.get(response_type)
+        if decoded is None:
+            if response_type == "json":
+                decoded = json_loads(self.raw)
+            else:
+                try:
+                    decoded = str(self.raw, self.encoding or "utf-8", errors="replace")
+                except LookupError:
+                    # Unknown encoding name from server
+                    decoded = str(self.raw, "utf-8", errors="replace")
+            self._decoded[response_type] = decoded
+        return decoded
 
 
 class URLFetchManager:
@@ -16,9 +52,11 @@ class URLFetchManager:
 
     Features:
     - In-memory cache with TTL (prevents duplicate requests in single run)
+    - Single-flight coalescing of concurrent identical requests
     - Domain-level rate limiting (prevents overwhelming APIs)
     - Thread-safe for parallel widget fetching
     - Automatic retry with exponential backoff
+    - Shared requests.Session with HTTP keep-alive (connection reuse across calls)
     - Support for JSON, text, and binary responses
 
     Example usage:
@@ -48,32 +86,66 @@ class URLFetchManager:
         self,
         cache_ttl_seconds: int = 180,  # 3 minute TTL
         default_timeout: int = 10,
+        connect_timeout: float = 5.0,
         default_user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36",
         max_retries: int = 3,
         retry_min_wait: int = 2,
         retry_max_wait: int = 10,
+        cache_max_entries: int = 512,
+        pool_connections: int = 64,
+        pool_maxsize: int = 16,
     ):
         """Initialize URL fetch manager.
 
         Args:
             cache_ttl_seconds: Cache TTL in seconds
-            default_timeout: Default request timeout in seconds
+            default_timeout: Default request (read) timeout in seconds
+            connect_timeout: Upper bound on the TCP/TLS connect phase in seconds, so
+                unreachable hosts fail fast even with a long read timeout
             default_user_agent: Default User-Agent header
             max_retries: Maximum number of retry attempts
             retry_min_wait: Minimum wait time between retries (seconds)
             retry_max_wait: Maximum wait time between retries (seconds)
+            cache_max_entries: Maximum number of cached responses (least recently used evicted first)
+            pool_connections: Number of per-host connection pools kept alive
+            pool_maxsize: Maximum keep-alive connections per host
         """
-        # Cache
-        self._cache: Dict[str, tuple[Any, datetime]] = {}
+        # Cache (LRU ordered: least recently used first).
+        # Values are (response, monotonic expiry); bodies are decoded on first retrieval.
+        self._cache: "OrderedDict[str, tuple[_CachedResponse, float]]" = OrderedDict()
         self._cache_lock = Lock()
-        self._cache_ttl = timedelta(seconds=cache_ttl_seconds)
+        self._cache_ttl = float(cache_ttl_seconds)
+        self._cache_max_entries = cache_max_entries
+
+        # In-flight requests by cache key, so concurrent identical requests share one fetch
+        self._pending: Dict[str, Future] = {}
+        self._pending_lock = Lock()
 
         # Domain rate limiting
         self._domain_semaphores: Dict[str, Semaphore] = {}
         self._semaphore_lock = Lock()
+        # Monotonic time each domain's last request finished (guarded by the domain semaphore)
+        self._domain_last_request: Dict[str, float] = {}
+
+        # Shared session so connections (and TLS handshakes) are reused across requests.
+        # Many distinct hosts are hit per run (article metadata), so keep plenty of host
+        # pools alive; per-host concurrency is low because of domain rate limiting.
+        # Retries are handled in get(), so the adapter itself never retries.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         # HTTP settings
         self.default_timeout = default_timeout
+        self.connect_timeout = connect_timeout
+        # Browser-like headers for better compatibility (built once, copied per request)
+        self._default_headers = {
+            "User-Agent": default_user_agent,
+            "Accept-Language": "en-US,en;q=0.9",
+            "DNT": "1",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        }
         self.default_user_agent = default_user_agent
         self.max_retries = max_retries
         self.retry_min_wait = retry_min_wait
@@ -100,21 +172,18 @@ class URLFetchManager:
     ) -> str:
         """Generate consistent cache key from URL, params, and relevant headers.
 
-        Cache key includes:
+        Cache key is a fixed-length digest of a canonical request string:
         - URL
-        - Sorted query parameters
+        - Sorted, URL-encoded query parameters
         - Authorization headers (if present)
 
         This ensures the same request always generates the same cache key.
         """
         key_parts = [url]
 
-        # Add sorted params
+        # Add sorted, encoded params (encoding keeps '&'/'=' inside values unambiguous)
         if params:
-            sorted_params = "&".join(
-                f"{k}={v}" for k, v in sorted(params.items())
-            )
-            key_parts.append(sorted_params)
+            key_parts.append(urlencode(sorted((str(k), str(v)) for k, v in params.items())))
 
         # Add auth headers (they affect response content)
         if headers:
@@ -128,30 +197,36 @@ class URLFetchManager:
                 )
                 key_parts.append(sorted_auth)
 
-        # Generate hash for long URLs
-        cache_key = "|".join(key_parts)
-        if len(cache_key) > 200:
-            # Use hash for very long cache keys
-            return hashlib.sha256(cache_key.encode()).hexdigest()
+        return hashlib.blake2b("|".join(key_parts).encode(), digest_size=16).hexdigest()
 
-        return cache_key
-
-    def _check_cache(self, cache_key: str) -> Optional[Any]:
+    def _check_cache(self, cache_key: str) -> Optional[_CachedResponse]:
         """Check cache for valid entry (thread-safe)."""
         with self._cache_lock:
-            if cache_key in self._cache:
-                data, timestamp = self._cache[cache_key]
-                if datetime.now(timezone.utc) - timestamp < self._cache_ttl:
-                    return data
-                else:
-                    # Expired, remove it
-                    del self._cache[cache_key]
+            entry = self._cache.get(cache_key)
+            if entry is None:
+                return None
+            data, expiry = entry
+            if time.monotonic() < expiry:
+                self._cache.move_to_end(cache_key)
+                return data
+            # Expired, remove it
+            del self._cache[cache_key]
         return None
 
-    def _store_cache(self, cache_key: str, data: Any):
-        """Store data in cache (thread-safe)."""
+    def _store_cache(self, cache_key: str, data: _CachedResponse, ttl: Optional[float] = None):
+        """Store response in cache (thread-safe).
+
+        Args:
+            cache_key: Cache key
+            data: Response to cache
+            ttl: TTL in seconds for this entry (uses the manager default if not specified)
+        """
+        ttl = self._cache_ttl if ttl is None else ttl
         with self._cache_lock:
-            self._cache[cache_key] = (data, datetime.now(timezone.utc))
+            self._cache[cache_key] = (data, time.monotonic() + ttl)
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self._cache_max_entries:
+                self._cache.popitem(last=False)
 
     def _make_request(
         self,
@@ -160,25 +235,16 @@ class URLFetchManager:
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> requests.Response:
-        """Make HTTP request with retry logic.
+        """Make a single HTTP request (retries are handled by _request_with_retry)."""
+        # Merge with default headers (custom headers override defaults)
+        final_headers = {**self._default_headers, **headers} if headers else self._default_headers
 
-        This method is decorated with @retry to handle transient failures.
-        """
-        # Merge with default headers (browser-like headers for better compatibility)
-        final_headers = {
-            "User-Agent": self.default_user_agent,
-            "Accept-Language": "en-US,en;q=0.9",
-            "DNT": "1",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        }
-        if headers:
-            final_headers.update(headers)  # Custom headers override defaults
-
-        # Use default timeout if not specified
-        final_timeout = timeout or self.default_timeout
+        # Use default timeout if not specified; (connect, read) tuple for requests
+        read_timeout = timeout or self.default_timeout
+        final_timeout = (min(self.connect_timeout, read_timeout), read_timeout)
 
         # Make request
-        response = requests.get(
+        response = self.session.get(
             url,
             params=params,
             headers=final_headers,
@@ -188,6 +254,40 @@ class URLFetchManager:
 
         return response
 
+    @staticmethod
+    def _is_retryable(error: requests.exceptions.RequestException) -> bool:
+        """Return False for client errors (4xx other than 429 Too Many Requests)."""
+        response = getattr(error, "response", None)
+        if response is None:
+            return True
+        status = response.status_code
+        return not (400 <= status < 500) or status == 429
+
+    def _request_with_retry(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+    ) -> requests.Response:
+        """Make HTTP request, retrying transient failures with exponential backoff.
+
+        Waits 2**(attempt - 1) seconds between attempts, clamped to
+        [retry_min_wait, retry_max_wait]. Re-raises the last error once
+        max_retries attempts have failed.
+
+        Only network errors, 5xx and 429 responses are retried: other 4xx
+        responses won't succeed on retry, and non-network errors
+        (e.g. parse errors) are never raised here.
+        """
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                return self._make_request(url, params, headers, timeout)
+            except requests.exceptions.RequestException as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    raise
+                time.sleep(min(self.retry_max_wait, max(self.retry_min_wait, 2 ** (attempt - 1))))
+
     def get(
         self,
         url: str,
@@ -196,11 +296,13 @@ class URLFetchManager:
         timeout: Optional[int] = None,
         response_type: Literal["json", "text", "binary"] = "json",
         use_cache: bool = True,
+        cache_ttl: Optional[float] = None,
     ) -> Any:
         """Make GET request with automatic caching, rate limiting, and retry logic.
 
         Thread-safe: Can be called from multiple threads simultaneously.
-        Rate limiting: Only one request per domain at a time.
+        Rate limiting: Only one request per domain at a time, spaced at least
+        DOMAIN_DELAY seconds apart.
 
         Args:
             url: Target URL
@@ -209,73 +311,103 @@ class URLFetchManager:
             timeout: Request timeout in seconds (uses default if not specified)
             response_type: How to parse response ("json", "text", or "binary")
             use_cache: Whether to use cache (default: True)
+            cache_ttl: Cache TTL in seconds for this response (uses the manager default if not specified)
 
         Returns:
-            Parsed response data based on response_type
+            Parsed response data based on response_type. Cached JSON/text results
+            are shared between callers, so treat them as read-only.
 
         Raises:
             requests.exceptions.RequestException: On HTTP errors after retries
             json.JSONDecodeError: If response_type="json" but response is not valid JSON
         """
+        if response_type not in ("json", "text", "binary"):
+            raise ValueError(f"Invalid response_type: {response_type}")
+
+        if not use_cache:
+            return self._fetch(url, params, headers, timeout, response_type).decode(response_type)
+
         # 1. Generate cache key
         cache_key = self._generate_cache_key(url, params, headers)
 
         # 2. Check cache (thread-safe)
-        if use_cache:
-            cached = self._check_cache(cache_key)
-            if cached is not None:
-                return cached
+        cached = self._check_cache(cache_key)
+        if cached is not None:
+            return cached.decode(response_type)
+
+        # 3. Single-flight: if the same request is already in flight, wait for its result
+        with self._pending_lock:
+            future = self._pending.get(cache_key)
+            is_owner = future is None
+            if is_owner:
+                # Re-check: the previous owner may have finished since our cache miss
+                cached = self._check_cache(cache_key)
+                if cached is not None:
+                    return cached.decode(response_type)
+                future = Future()
+                self._pending[cache_key] = future
+
+        if not is_owner:
+            return future.result().decode(response_type)
+
+        try:
+            response = self._fetch(url, params, headers, timeout, response_type)
+            # Decode before caching so a malformed body isn't served for the whole TTL
+            data = response.decode(response_type)
+            # Cache successful response (thread-safe)
+            self._store_cache(cache_key, response, cache_ttl)
+            future.set_result(response)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._pending_lock:
+                self._pending.pop(cache_key, None)
+
+        return data
+
+    def _fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[int],
+        response_type: str,
+    ) -> _CachedResponse:
+        """Fetch a response under the domain rate limit (no caching).
 
-        # 3. Extract domain for rate limiting
+        Returns:
+            Raw response body with its text encoding
+        """
+        # 1. Extract domain for rate limiting
         domain = urlparse(url).netloc
 
-        # 4. Get domain semaphore
+        # 2. Get domain semaphore
         semaphore = self._get_domain_semaphore(domain)
 
-        # 5. Acquire domain lock, fetch, delay, release
+        # 3. Acquire domain lock, wait out the remaining delay, fetch, release
         with semaphore:
+            # Only wait if the previous request to this domain finished less than
+            # DOMAIN_DELAY ago, instead of always sleeping after every request
+            last_request = self._domain_last_request.get(domain)
+            if last_request is not None:
+                remaining = last_request + self.DOMAIN_DELAY - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+
             # Make request with retry logic
             try:
-                # Apply retry decorator dynamically
-                retrying_request = retry(
-                    stop=stop_after_attempt(self.max_retries),
-                    wait=wait_exponential(
-                        multiplier=1,
-                        min=self.retry_min_wait,
-                        max=self.retry_max_wait
-                    ),
-                    reraise=True
-                )(self._make_request)
-
-                response = retrying_request(url, params, headers, timeout)
-
-                # Parse response based on type
-                if response_type == "json":
-                    data = response.json()
-                elif response_type == "text":
-                    data = response.text
-                elif response_type == "binary":
-                    data = response.content
-                else:
-                    raise ValueError(f"Invalid response_type: {response_type}")
-
-                # Cache successful response (thread-safe)
-                if use_cache:
-                    self._store_cache(cache_key, data)
-
-                # Rate limit delay BEFORE releasing semaphore
-                # This ensures next request to this domain waits
-                time.sleep(self.DOMAIN_DELAY)
-
-                return data
-
-            except RetryError as e:
-                # All retries exhausted
-                raise e.last_attempt.exception()
-            except requests.exceptions.RequestException as e:
-                raise
-            except json.JSONDecodeError as e:
-                raise
+                response = self._request_with_retry(url, params, headers, timeout)
+
+                # Keep the raw body; parsing happens on retrieval. Only text responses
+                # need an encoding guess when the server didn't declare one.
+                encoding = response.encoding
+                if encoding is None and response_type == "text":
+                    encoding = response.apparent_encoding
+                return _CachedResponse(response.content, encoding)
+            finally:
+                # Next request to this domain waits relative to this one
+                self._domain_last_request[domain] = time.monotonic()
 
     def clear_cache(self):
         """Clear all cached responses (thread-safe)."""
@@ -290,3 +422,12 @@ _url_fetch_manager = URLFetchManager()
 def get_url_fetch_manager() -> URLFetchManager:
     """Get the global URL fetch manager instance."""
     return _url_fetch_manager
+
+
+def get_http_session() -> requests.Session:
+    """Get the shared HTTP session for requests that can't go through get().
+
+    Use this for non-GET calls or other low-level requests so they still
+    benefit from connection pooling.
+    """
+    return _url_fetch_manager.session
@@ -11,13 +11,17 @@ Uses persistent disk cache with long TTL to minimize fetches (most metadata does
 Follows design patterns from DESIGN.md (graceful degradation, retry logic, emoji logging).
 """
 
-from typing import Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Dict, Any, List, Optional
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 
 from .url_fetch_manager import get_url_fetch_manager
+from .memory_cache import MemoryCache
 from .output_manager import OutputManager
 from .persistent_cache import PersistentCache
+from .utils import normalize_url
 
 
 class URLMetadata:
@@ -50,6 +54,13 @@ class URLMetadata:
         """Check if metadata has any rich content (image or description)."""
         return bool(self.image or self.description)
 
+    def is_empty(self) -> bool:
+        """Check if no metadata at all was extracted (e.g. the fetch failed)."""
+        return not (
+            self.title or self.description or self.image or self.favicon
+            or self.site_name or self.author or self.keywords
+        )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'URLMetadata':
         """Create URLMetadata from dictionary."""
@@ -68,7 +79,8 @@ class URLMetadataExtractor:
     """Extract rich metadata from web pages.
 
     Supports Open Graph, Twitter Cards, standard meta tags, and favicons.
-    Uses persistent disk cache with 30-day TTL to minimize fetches.
+    Uses persistent disk cache with 30-day TTL to minimize fetches, fronted by
+    an in-process memo keyed by normalized URL.
     Extremely robust to handle slow sites, 404s, timeouts, and any other failures.
 
     Example usage:
@@ -81,11 +93,16 @@ class URLMetadataExtractor:
             OutputManager.log(f"Description: {metadata.description}")
     """
 
-    def __init__(self, persistent_cache: Optional[PersistentCache[URLMetadata]] = None):
+    def __init__(
+        self,
+        persistent_cache: Optional[PersistentCache[URLMetadata]] = None,
+        max_workers: int = 16,
+    ):
         """Initialize metadata extractor with HTTP client and persistent cache.
 
         Args:
             persistent_cache: Persistent cache instance (creates new one if not provided)
+            max_workers: Size of the extraction pool shared by all widgets (default: 16)
         """
         self.http_client = get_url_fetch_manager()
         self.persistent_cache = persistent_cache or PersistentCache[URLMetadata](
@@ -94,6 +111,44 @@ class URLMetadataExtractor:
             serializer=lambda meta: meta.to_dict(),
             deserializer=URLMetadata.from_dict
         )
+        # Negative cache: URLs that yielded no metadata, so repeat lookups skip the fetch
+        self._known_empty = MemoryCache[bool](ttl_seconds=24 * 3600, max_entries=10000)
+        # In-process layer over the disk cache, keyed by normalized URL (tracking params stripped)
+        self._memo = MemoryCache[URLMetadata](ttl_seconds=3600, max_entries=1024)
+
+        # One bounded pool for every widget's batch, so parallel widgets don't
+        # each spawn their own threads. In-flight extractions are shared by URL.
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="url-metadata")
+        self._pending: Dict[tuple, Future] = {}
+        self._pending_lock = Lock()
+
+    def is_known_empty(self, url: str) -> bool:
+        """Check if url recently yielded no metadata (within 24h)."""
+        return url in self._known_empty
+
+    def get_cached(self, url: str) -> Optional[URLMetadata]:
+        """Get metadata for url from the caches only, never fetching.
+
+        Checks the negative cache, the in-process memo, then the persistent cache.
+
+        Returns:
+            Cached URLMetadata (may be empty), or None if url isn't cached
+        """
+        if self.is_known_empty(url):
+            return URLMetadata(url)
+
+        memo_key = normalize_url(url)
+        memoized = self._memo.get(memo_key)
+        if memoized is not None:
+            return memoized
+
+        cached = self.persistent_cache.get(url)
+        if cached is not None:
+            if cached.is_empty():
+                self._known_empty.set(url, True)
+            else:
+                self._memo.set(memo_key, cached)
+        return cached
 
     def extract(
         self,
@@ -121,9 +176,9 @@ class URLMetadataExtractor:
             - Follows redirects automatically
             - Prefers Open Graph tags over standard meta tags
         """
-        # Check persistent cache first (unless force_refetch)
+        # Check caches first (unless force_refetch)
         if use_cache and not force_refetch:
-            cached = self.persistent_cache.get(url)
+            cached = self.get_cached(url)
             if cached is not None:
                 return cached
 
@@ -152,6 +207,10 @@ class URLMetadataExtractor:
             # Save to persistent cache (even if empty - prevents retrying failed URLs)
             if use_cache:
                 self.persistent_cache.set(url, metadata)
+                if metadata.is_empty():
+                    self._known_empty.set(url, True)
+                else:
+                    self._memo.set(normalize_url(url), metadata)
 
             return metadata
 
@@ -164,6 +223,7 @@ class URLMetadataExtractor:
             # Cache the failure too (prevents retrying same failed URL repeatedly)
             if use_cache:
                 self.persistent_cache.set(url, empty_metadata)
+                self._known_empty.set(url, True)
 
             return empty_metadata
 
@@ -329,37 +389,117 @@ class URLMetadataExtractor:
             - **Aggressive caching**: Most URLs will hit 30-day cache
             - **Extremely robust**: Individual failures don't stop batch processing
             - **Never returns None**: All URLs get URLMetadata (may be empty)
-            - Processes URLs sequentially (respects rate limits)
-            - Duplicate URLs only fetched once
+            - Processes hosts concurrently on the shared extraction pool,
+              URLs on the same host sequentially (per-domain rate limit)
+            - Duplicate URLs only fetched once, including across widgets
+              whose batches overlap in time
         """
+        # Deduplicate while preserving order, then group by host: the fetch manager
+        # allows one request per domain at a time, so same-host URLs run back to back
+        # in one task (reusing its keep-alive connection) instead of parking several
+        # pool workers on the domain lock
+        unique_urls = list(dict.fromkeys(urls))
+        by_host: Dict[str, List[str]] = {}
+        for url in unique_urls:
+            by_host.setdefault(urlparse(url).netloc, []).append(url)
+
+        futures: Dict[str, Future] = {}
+        for host_urls in by_host.values():
+            host_futures = self._submit_group(host_urls, timeout, use_cache, force_refetch)
+            futures.update(zip(host_urls, host_futures))
+
         results = {}
+        for url in unique_urls:
+            try:
+                results[url] = futures[url].result()
+            except Exception as e:
+                # extract() handles fetch errors itself; this only guards against bugs
+                OutputManager.log(f"⚠️  Failed to fetch metadata for {url}: {e}")
+                results[url] = URLMetadata(url)
+        return results
 
-        for url in urls:
-            # extract() never raises, always returns URLMetadata
-            metadata = self.extract(
-                url,
-                timeout=timeout,
-                use_cache=use_cache,
-                force_refetch=force_refetch
-            )
-            results[url] = metadata
+    def submit(
+        self,
+        url: str,
+        timeout: int = 5,
+        use_cache: bool = True,
+        force_refetch: bool = False,
+    ) -> Future:
+        """Schedule extract() on the shared pool, joining an identical in-flight request.
 
-        # Count successful extractions with rich data
-        return results
+        Lets callers start extraction as soon as a URL is known (e.g. right after
+        a redirect resolves) and collect the URLMetadata later via result().
+        The future never raises, since extract() doesn't.
+        """
+        return self._submit_group([url], timeout, use_cache, force_refetch)[0]
+
+    def _submit_group(
+        self,
+        urls: List[str],
+        timeout: int,
+        use_cache: bool,
+        force_refetch: bool,
+    ) -> List[Future]:
+        """Schedule extract() for urls as one sequential task, returning a future per URL.
+
+        URLs already in flight join the existing future; the rest are claimed
+        here and extracted in order by a single pool task.
+        """
+        futures = []
+        claimed = []
+        with self._pending_lock:
+            for url in urls:
+                key = (url, timeout, use_cache, force_refetch)
+                future = self._pending.get(key)
+                if future is None:
+                    future = Future()
+                    self._pending[key] = future
+                    claimed.append((key, url, future))
+                futures.append(future)
+
+        # Registered outside the lock: the callback runs immediately if the
+        # future has already finished, and it takes the lock itself
+        for key, _, future in claimed:
+            future.add_done_callback(lambda done, key=key: self._forget_pending(key, done))
+
+        if claimed:
+            self._executor.submit(self._run_group, claimed, timeout, use_cache, force_refetch)
+        return futures
+
+    def _run_group(self, claimed: List[tuple], timeout: int, use_cache: bool, force_refetch: bool):
+        for _, url, future in claimed:
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                metadata = self.extract(url, timeout=timeout, use_cache=use_cache, force_refetch=force_refetch)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(metadata)
+
+    def _forget_pending(self, key: tuple, future: Future):
+        with self._pending_lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
 
 
-# Global instance
+# Global instance (created lazily; widgets fetch in parallel threads)
 _url_metadata_extractor = None
+_url_metadata_extractor_lock = Lock()
 
 
 def get_url_metadata_extractor() -> URLMetadataExtractor:
     """Get the global URL metadata extractor instance.
 
-    Uses singleton pattern to ensure all widgets share the same HTTP cache.
+    Uses singleton pattern to ensure all widgets share the same HTTP cache,
+    extraction pool and in-flight requests. Creation is locked so widgets
+    starting in parallel can't each build their own extractor.
     """
     global _url_metadata_extractor
     if _url_metadata_extractor is None:
-        _url_metadata_extractor = URLMetadataExtractor()
+        with _url_metadata_extractor_lock:
+            if _url_metadata_extractor is None:
+                _url_metadata_extractor = URLMetadataExtractor()
     return _url_metadata_extractor
 
 
@@ -1,14 +1,55 @@
 """Utility functions."""
 
+import html
 import json
+import re
 import time
 from datetime import datetime, timezone
-from urllib.parse import urlparse, quote
+from functools import lru_cache
+from threading import Lock
+from urllib.parse import urlparse, parse_qsl, quote, urlencode
 from typing import Optional
 
-import requests
 from bs4 import BeautifulSoup
 
+from .url_fetch_manager import get_http_session
+
+# Relative time bucket thresholds (seconds)
+_MINUTE = 60
+_HOUR = 3600
+_DAY = 86400
+_MONTH = 2592000  # 30 days
+
+# format_time_ago buckets: (upper bound, divisor, unit suffix)
+_TIME_AGO_BUCKETS = (
+    (_MINUTE, 1, "s"),
+    (_HOUR, _MINUTE, "m"),
+    (_DAY, _HOUR, "h"),
+    (_MONTH, _DAY, "d"),
+)
+
+# Matches "scheme://netloc" at the start of a URL (group 2 is the netloc)
+_URL_RE = re.compile(r'^([a-zA-Z][a-zA-Z0-9+.-]*)://([^/?#]+)', re.ASCII)
+
+# (divisor, suffix) pairs for format_large_number, largest first
+_NUMBER_SCALES = (
+    (1_000_000_000, "B"),
+    (1_000_000, "M"),
+    (1_000, "K"),
+)
+
+# data-p attribute of the first <c-wiz> element on a Google News article page
+_DATA_P_RE = re.compile(rb'<c-wiz\b[^>]*?\sdata-p="([^"]*)"')
+
+# Size of the per-process memo caches for URL helpers (URLs repeat across widgets)
+_URL_CACHE_SIZE = 2048
+
+# Query parameters stripped by normalize_url
+_TRACKING_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', 'msclkid', 'mc_cid', 'mc_eid',
+})
+
 
 def format_time_ago(timestamp_str: str) -> str:
     """Convert ISO timestamp to relative time string.
@@ -20,78 +61,58 @@ def format_time_ago(timestamp_str: str) -> str:
         Human-readable relative time (e.g., "5m ago", "2h ago", "3d ago")
     """
     try:
-        # Parse ISO timestamp (handle both with and without microseconds)
-        if '.' in timestamp_str:
-            timestamp = datetime.fromisoformat(timestamp_str.split('.')[0])
-        else:
-            timestamp = datetime.fromisoformat(timestamp_str)
+        # Parse ISO timestamp (fractional seconds and "Z"/offset suffixes included)
+        timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
 
         # Make timezone-aware if naive (assume UTC)
         if timestamp.tzinfo is None:
             timestamp = timestamp.replace(tzinfo=timezone.utc)
 
-        now = datetime.now(timezone.utc)
-        delta = now - timestamp
-
-        # Calculate time difference
-        seconds = delta.total_seconds()
-
-        if seconds < 0:
+        delta_seconds = (datetime.now(timezone.utc) - timestamp).total_seconds()
+        if delta_seconds < 0:
             return "just now"
 
-        minutes = seconds / 60
-        hours = minutes / 60
-        days = hours / 24
-
-        if seconds < 60:
-            return f"{int(seconds)}s ago"
-        elif minutes < 60:
-            return f"{int(minutes)}m ago"
-        elif hours < 24:
-            return f"{int(hours)}h ago"
-        elif days < 30:
-            return f"{int(days)}d ago"
-        else:
-            months = days / 30
-            return f"{int(months)}mo ago"
+        # Integer bucket lookup: (upper bound, divisor, unit)
+        seconds = int(delta_seconds)
+        for upper, divisor, unit in _TIME_AGO_BUCKETS:
+            if seconds < upper:
+                return f"{seconds // divisor}{unit} ago"
+        return f"{seconds // _MONTH}mo ago"
 
     except Exception as e:
         # Fallback to original timestamp if parsing fails
         return timestamp_str[:19]
 
 
-def format_timestamp_ago(timestamp: float) -> str:
+def format_timestamp_ago(timestamp: float, now: Optional[float] = None) -> str:
     """Convert Unix timestamp to relative time string.
 
     Args:
         timestamp: Unix timestamp (seconds since epoch)
+        now: Current Unix time (default: time.time()); pass one value when
+            formatting many timestamps in a loop
 
     Returns:
         Human-readable relative time (e.g., "5m ago", "2h ago", "3d ago")
     """
     try:
-        from datetime import datetime
-
-        # Convert Unix timestamp to datetime
-        pub_date = datetime.fromtimestamp(timestamp)
-        now = datetime.now()
-        diff = now - pub_date
-
-        if diff.days > 0:
-            if diff.days >= 30:
-                months = diff.days // 30
-                return f"{months}mo ago"
-            else:
-                return f"{diff.days}d ago"
-        elif diff.seconds >= 3600:
-            hours = diff.seconds // 3600
-            return f"{hours}h ago"
-        elif diff.seconds >= 60:
-            minutes = diff.seconds // 60
-            return f"{minutes}m ago"
+        # Epoch arithmetic instead of building two datetimes; divmod floors like timedelta
+        if now is None:
+            now = time.time()
+        days, seconds = divmod(now - timestamp, _DAY)
+
+        if days > 0:
+            days = int(days)
+            if days >= 30:
+                return f"{days // 30}mo ago"
+            return f"{days}d ago"
+        elif seconds >= _HOUR:
+            return f"{int(seconds) // _HOUR}h ago"
+        elif seconds >= _MINUTE:
+            return f"{int(seconds) // _MINUTE}m ago"
         else:
             return "just now"
-    except:
+    except Exception:
         return ""
 
 
@@ -117,14 +138,10 @@ def format_large_number(value: float) -> str:
     Returns:
         Formatted string (e.g., "1.5M", "2.3B")
     """
-    if value >= 1_000_000_000:
-        return f"${value / 1_000_000_000:.2f}B"
-    elif value >= 1_000_000:
-        return f"${value / 1_000_000:.2f}M"
-    elif value >= 1_000:
-        return f"${value / 1_000:.2f}K"
-    else:
-        return f"${value:.2f}"
+    for divisor, suffix in _NUMBER_SCALES:
+        if value >= divisor:
+            return f"${value / divisor:.2f}{suffix}"
+    return f"${value:.2f}"
 
 
 def extract_domain(url: str) -> str:
@@ -140,13 +157,23 @@ def extract_domain(url: str) -> str:
         >>> extract_domain("https://www.example.com/path?query=1")
         "www.example.com"
     """
-    try:
-        parsed = urlparse(url)
-        return parsed.netloc
-    except Exception:
+    return _extract_domain_fast(url)
+
+
+def _extract_domain_fast(url: str) -> str:
+    """Return the netloc of url using a single regex match, or "" if it has none."""
+    if not isinstance(url, str):
         return ""
+    return _cached_domain(url)
 
 
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _cached_domain(url: str) -> str:
+    match = _URL_RE.match(url)
+    return match.group(2) if match else ""
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
 def get_favicon_url(url: str) -> str:
     """Get favicon URL for a domain using Google's favicon service.
 
@@ -165,7 +192,7 @@ def get_favicon_url(url: str) -> str:
         - Returns default icon if domain has no favicon
         - 32px size is good for most use cases
     """
-    domain = extract_domain(url)
+    domain = _extract_domain_fast(url)
     if not domain:
         return ""
     return f"https://www.google.com/s2/favicons?domain={domain}&sz=32"
@@ -186,10 +213,11 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
         >>> truncate_text("This is a very long text", max_length=15)
         "This is a ve..."
     """
+    # Common case: already fits, return the same object without copying
     if not text or len(text) <= max_length:
         return text
 
-    return text[:max_length - len(suffix)] + suffix
+    return f"{text[:max_length - len(suffix)]}{suffix}"
 
 
 def is_valid_url(url: str) -> bool:
@@ -207,13 +235,10 @@ def is_valid_url(url: str) -> bool:
         >>> is_valid_url("not a url")
         False
     """
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except Exception:
-        return False
+    return isinstance(url, str) and _URL_RE.match(url) is not None
 
 
+@lru_cache(maxsize=_URL_CACHE_SIZE)
 def normalize_url(url: str) -> str:
     """Normalize URL by removing tracking parameters and fragments.
 
@@ -231,26 +256,27 @@ def normalize_url(url: str) -> str:
         - Removes common tracking parameters (utm_*, fbclid, etc.)
         - Removes URL fragments (#section)
         - Useful for deduplication and caching
+        - Results are memoized per process (pure function of url)
     """
+    # Non-string input is returned as-is, like any other unparseable URL
+    if not isinstance(url, str):
+        return url
+
+    # Fast path: nothing to strip
+    if '?' not in url and '#' not in url:
+        return url
+
     try:
         parsed = urlparse(url)
 
-        # Remove common tracking parameters
-        tracking_params = {
-            'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
-            'fbclid', 'gclid', 'msclkid', 'mc_cid', 'mc_eid',
-        }
-
         # Parse query string and filter out tracking params
-        from urllib.parse import parse_qs, urlencode
-        query_dict = parse_qs(parsed.query)
-        filtered_query = {
-            k: v for k, v in query_dict.items()
-            if k not in tracking_params
-        }
+        filtered_query = [
+            (k, v) for k, v in parse_qsl(parsed.query)
+            if k not in _TRACKING_PARAMS
+        ]
 
         # Reconstruct URL without fragment and tracking params
-        clean_query = urlencode(filtered_query, doseq=True) if filtered_query else ''
+        clean_query = urlencode(filtered_query) if filtered_query else ''
         clean_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
         if clean_query:
             clean_url += f"?{clean_query}"
@@ -261,6 +287,34 @@ def normalize_url(url: str) -> str:
         return url
 
 
+class _TokenBucket:
+    """Thread-safe token bucket: allows short bursts, then a steady request rate."""
+
+    def __init__(self, rate_per_second: float, capacity: int):
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now (may go negative) so waiters queue up fairly
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Shared across all threads and widgets: ~1 request/second to news.google.com,
+# with a small burst so a default 5-article feed resolves without waiting
+_google_news_rate_limiter = _TokenBucket(rate_per_second=1.0, capacity=5)
+
+
 def resolve_google_news_url(google_rss_url: str, timeout: float = 10.0) -> str:
     """Resolve the final redirect URL from a Google News RSS article link.
 
@@ -282,26 +336,34 @@ def resolve_google_news_url(google_rss_url: str, timeout: float = 10.0) -> str:
 
     Notes:
         - Only resolves URLs starting with "https://news.google.com/rss/"
-        - Includes 1-second delay to prevent rate limiting
+        - Rate limited to ~1 request/second (shared token bucket) to prevent throttling
         - Gracefully returns original URL on any error
         - Uses Google's internal batch execute API
+        - Reuses the shared HTTP session (keep-alive to news.google.com)
     """
     if not google_rss_url.startswith("https://news.google.com/rss/"):
         return google_rss_url
 
-    # Add delay to prevent rate limiting
-    time.sleep(1)
+    # Wait for a rate limit token (shared by all threads)
+    _google_news_rate_limiter.acquire()
 
     try:
         # Step 1: Fetch Google News page to extract data-p attribute
-        resp = requests.get(google_rss_url, timeout=timeout)
-        soup = BeautifulSoup(resp.text, 'html.parser')
-        c_wiz = soup.select_one('c-wiz[data-p]')
+        resp = get_http_session().get(google_rss_url, timeout=timeout)
+
+        # Targeted scan for the attribute; only build a DOM if that misses
+        match = _DATA_P_RE.search(resp.content)
+        if match:
+            data = html.unescape(match.group(1).decode('utf-8', 'replace'))
+        else:
+            soup = BeautifulSoup(resp.text, 'html.parser')
+            c_wiz = soup.select_one('c-wiz[data-p]')
+
+            if not c_wiz:
+                return google_rss_url
 
-        if not c_wiz:
-            return google_rss_url
+            data = c_wiz.get('data-p')
 
-        data = c_wiz.get('data-p')
         obj = json.loads(data.replace('%.@.', '["garturlreq",'))
 
     except Exception:
@@ -319,7 +381,7 @@ def resolve_google_news_url(google_rss_url: str, timeout: float = 10.0) -> str:
 
     url = "https://news.google.com/_/DotsSplashUi/data/batchexecute"
     try:
-        response = requests.post(url, headers=headers, data=payload, timeout=timeout)
+        response = get_http_session().post(url, headers=headers, data=payload, timeout=timeout)
         array_string = json.loads(response.text.replace(")]}'", ""))[0][2]
         article_url = json.loads(array_string)[1]
         return article_url
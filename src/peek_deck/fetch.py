@@ -9,6 +9,9 @@ from .core.cache import Cache
 from .core.loader import discover_all_pages, load_page_config, create_widget_instance
 from .core.output_manager import OutputManager
 
+# Upper bound on concurrent widget fetches (widgets are network-bound, rate limits are per domain)
+MAX_FETCH_WORKERS = 32
+
 
 def fetch_widget(
     widget_type: str,
@@ -140,9 +143,10 @@ def fetch_all():
 
     # Fetch widgets in parallel
     if widgets_to_fetch:
-        print(f"\n🚀 Fetching {len(widgets_to_fetch)} widget(s) in parallel (max 10 concurrent)...\n")
+        max_workers = min(MAX_FETCH_WORKERS, len(widgets_to_fetch))
+        print(f"\n🚀 Fetching {len(widgets_to_fetch)} widget(s) in parallel (max {max_workers} concurrent)...\n")
 
-        with ThreadPoolExecutor(max_workers=10) as executor:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all tasks
             futures = {
                 executor.submit(
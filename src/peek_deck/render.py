@@ -1,14 +1,15 @@
 """Stage 3: Render HTML from processed data."""
 
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader
 
 from .core.cache import Cache
+from .core.fast_json import loads as json_loads
 from .core.loader import (
     discover_all_pages,
     load_page_config,
+    load_yaml,
     create_widget_instance
 )
 # Import project name from central config
@@ -17,8 +18,6 @@ from peek_deck import PROJECT_NAME, PROJECT_TAGLINE
 
 def render_all():
     """Render HTML pages from processed data."""
-    import yaml
-
     project_root = Path.cwd()
     data_processed_dir = project_root / "data" / "processed"
     docs_dir = project_root / "docs"
@@ -40,12 +39,11 @@ def render_all():
 
     if index_config_file.exists():
         try:
-            with open(index_config_file, 'r') as f:
-                index_config = yaml.safe_load(f)
-                if index_config:
-                    base_url = index_config.get('base_url')
-                    github_url = index_config.get('github_url')
-                    google_analytics_id = index_config.get('google_analytics_id')
+            index_config = load_yaml(index_config_file)
+            if index_config:
+                base_url = index_config.get('base_url')
+                github_url = index_config.get('github_url')
+                google_analytics_id = index_config.get('google_analytics_id')
         except Exception as e:
             print(f"⚠️  Failed to load config/index.yaml: {e}")
 
@@ -103,8 +101,7 @@ def render_all():
                 continue
 
             try:
-                with open(processed_file, 'r') as f:
-                    processed_data = json.load(f)
+                processed_data = json_loads(processed_file.read_bytes())
             except Exception as e:
                 print(f"    ❌ Failed to read {processed_file.name}: {e}")
                 continue
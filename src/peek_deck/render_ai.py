@@ -1,32 +1,75 @@
 """Stage 3b: Render AI-friendly Markdown from processed data."""
 
-import json
+import multiprocessing
+import os
+import re
+import sys
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+try:
+    from yaml import CSafeDumper as _YamlDumper  # LibYAML C emitter
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
 
 from .core.cache import Cache
+from .core.fast_json import loads as json_loads
 from .core.loader import (
     discover_all_pages,
     load_page_config,
+    load_yaml,
     create_widget_instance
 )
 from peek_deck import PROJECT_NAME, PROJECT_TAGLINE
 
+# First "## " header in a widget's markdown (used as its TOC title)
+_HEADER_RE = re.compile(r'^## (.+)$', re.MULTILINE)
+# TOC anchor cleanup for ASCII text: drop punctuation (anything that is not a
+# word character, whitespace or hyphen) and turn spaces into hyphens
+_ANCHOR_TABLE = str.maketrans({
+    chr(code): ('-' if code == 0x20 else None)
+    for code in range(128)
+    if code == 0x20 or not re.match(r'[\w\s-]', chr(code))
+})
+
+# Static page skeleton pieces for iter_page_markdown
+_PAGE_HEADER = (
+    "---\n{frontmatter}\n---\n\n"
+    "# {name} Dashboard\n\n{description}\n\n"
+    "**Last Updated:** {updated}  \n"  # Two spaces for hard line break
+    "{html_line}"
+    "\n---\n\n"
+)
+_SECTION_RULE = "\n---\n\n"
+_PAGE_FOOTER = f"*Generated by {PROJECT_NAME} - {PROJECT_TAGLINE}*\n"
+
+# Below this many pages, worker startup costs more than rendering in-process
+_PARALLEL_MIN_PAGES = 8
+
+# Frontmatter data_types: first rule with a token contained in the widget type wins
+_DATA_TYPE_RULES = (
+    (('price', 'market'), 'cryptocurrency'),
+    (('news',), 'news'),
+    (('reddit', 'hackernews'), 'social'),
+    (('github', 'huggingface'), 'repositories'),
+    (('youtube',), 'videos'),
+    (('papers',), 'research'),
+)
+
 
 def render_ai_all():
     """Render AI-friendly Markdown pages from processed data."""
     project_root = Path.cwd()
     data_processed_dir = project_root / "data" / "processed"
     docs_dir = project_root / "docs"
-    cache_dir = project_root / "data" / "cache"
 
     # Create directories
     docs_dir.mkdir(parents=True, exist_ok=True)
 
-    # Initialize cache
-    cache = Cache(cache_dir)
-
     # Load index config (for base_url)
     index_config_file = project_root / "config" / "index.yaml"
     index_config = None
@@ -34,15 +77,17 @@ def render_ai_all():
 
     if index_config_file.exists():
         try:
-            with open(index_config_file, 'r') as f:
-                index_config = yaml.safe_load(f)
-                if index_config:
-                    base_url = index_config.get('base_url')
+            index_config = load_yaml(index_config_file)
+            if index_config:
+                base_url = index_config.get('base_url')
         except Exception as e:
             print(f"⚠️  Failed to load config/index.yaml: {e}")
 
     print("📝 Stage 3b: Rendering AI-friendly Markdown pages\n")
 
+    # One timestamp for the whole pass, shared by every page
+    rendered_at = datetime.now(timezone.utc)
+
     # Track stats
     rendered_pages = 0
     failed_pages = 0
@@ -55,123 +100,188 @@ def render_ai_all():
 
     print(f"📄 Found {len(page_files)} page(s)\n")
 
-    for page_file in page_files:
-        # Load page config
+    render_page = partial(
+        _render_single_page,
+        data_processed_dir=data_processed_dir,
+        docs_dir=docs_dir,
+        base_url=base_url,
+        rendered_at=rendered_at,
+    )
+
+    # Pages are independent, so larger sites render them in worker processes
+    # (CPU-bound JSON/YAML parsing and markdown building). Results come back
+    # in page order. Workers are spawned rather than forked so they don't
+    # inherit the parent's threads and locks.
+    max_workers = min(os.cpu_count() or 1, len(page_files))
+    executor = None
+    if max_workers > 1 and len(page_files) >= _PARALLEL_MIN_PAGES:
         try:
-            page_config = load_page_config(page_file)
-        except Exception as e:
-            print(f"❌ Failed to load {page_file.name}: {e}")
-            failed_pages += 1
-            continue
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        except (OSError, NotImplementedError):
+            # No multiprocessing support on this platform: render sequentially
+            executor = None
+
+    if executor is None:
+        results = map(render_page, page_files)
+    else:
+        results = executor.map(render_page, page_files)
+
+    try:
+        for status, lines in results:
+            # One write per page instead of a print (and flush) per line
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+            if status is True:
+                rendered_pages += 1
+            elif status is False:
+                failed_pages += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-        if not page_config.enabled:
-            continue
+    # Print summary
+    rule = '=' * 60
+    sys.stdout.write(
+        f"\n{rule}\n"
+        f"📊 AI Markdown Render Summary:\n"
+        f"   ✅ Rendered: {rendered_pages} markdown pages\n"
+        f"   ❌ Failed: {failed_pages} pages\n"
+        f"   📁 Output: {docs_dir}\n"
+        f"{rule}\n\n"
+    )
+
+
+@lru_cache(maxsize=None)
+def _data_type_for(widget_type: str) -> Optional[str]:
+    """Map a widget type to its frontmatter data type (None if uncategorized)."""
+    for tokens, data_type in _DATA_TYPE_RULES:
+        if any(token in widget_type for token in tokens):
+            return data_type
+    return None
+
+
+def _render_single_page(
+    page_file: Path,
+    data_processed_dir: Path,
+    docs_dir: Path,
+    base_url: Optional[str],
+    rendered_at: datetime,
+) -> Tuple[Optional[bool], List[str]]:
+    """Render one page to docs/{page_id}.md (runs in a worker process).
 
-        print(f"📝 Rendering AI markdown: {page_config.id} ({page_config.name}) [{page_config.category}]")
+    Args:
+        page_file: Page config file
+        data_processed_dir: Directory with processed widget data
+        docs_dir: Output directory
+        base_url: Base URL for the site
+        rendered_at: Render timestamp shared by all pages
 
-        # Collect widget markdown and metadata
-        widgets_markdown = []
-        widget_types = []
-        data_types = set()
+    Returns:
+        (status, log lines) where status is True if rendered, False if the
+        page failed, and None if the page is disabled
+    """
+    lines = []
+    log = lines.append
+
+    # Load page config
+    try:
+        page_config = load_page_config(page_file)
+    except Exception as e:
+        log(f"❌ Failed to load {page_file.name}: {e}")
+        return False, lines
+
+    if not page_config.enabled:
+        return None, lines
+
+    log(f"📝 Rendering AI markdown: {page_config.id} ({page_config.name}) [{page_config.category}]")
+
+    # Collect widget markdown and metadata
+    widgets_markdown = []
+    widget_types = []
+    data_types = set()
+
+    for widget_config in page_config.widgets:
+        widget_type = widget_config.type
+
+        # Generate cache key
+        cache_key = Cache.get_cache_key(
+            page_config.category,
+            page_config.id,
+            widget_type,
+            widget_config.params
+        )
+
+        # Load processed data
+        processed_file = data_processed_dir / f"{cache_key}.json"
+        if not processed_file.exists():
+            log(f"    ⚠️  No processed data for {widget_type}, skipping")
+            continue
 
-        for widget_config in page_config.widgets:
-            widget_type = widget_config.type
+        try:
+            processed_data = json_loads(processed_file.read_bytes())
+        except Exception as e:
+            log(f"    ❌ Failed to read {processed_file.name}: {e}")
+            continue
 
-            # Generate cache key
-            cache_key = cache.get_cache_key(
-                page_config.category,
-                page_config.id,
-                widget_type,
-                widget_config.params
+        # Create widget instance
+        try:
+            widget = create_widget_instance(
+                widget_type=widget_type,
+                params=widget_config.params,
+                page_params=page_config.params,
+                update_minutes=widget_config.update_minutes
             )
+        except Exception as e:
+            log(f"    ❌ Failed to create widget {widget_type}: {e}")
+            continue
 
-            # Load processed data
-            processed_file = data_processed_dir / f"{cache_key}.json"
-            if not processed_file.exists():
-                print(f"    ⚠️  No processed data for {widget_type}, skipping")
-                continue
-
-            try:
-                with open(processed_file, 'r') as f:
-                    processed_data = json.load(f)
-            except Exception as e:
-                print(f"    ❌ Failed to read {processed_file.name}: {e}")
-                continue
-
-            # Create widget instance
-            try:
-                widget = create_widget_instance(
-                    widget_type=widget_type,
-                    params=widget_config.params,
-                    page_params=page_config.params,
-                    update_minutes=widget_config.update_minutes
-                )
-            except Exception as e:
-                print(f"    ❌ Failed to create widget {widget_type}: {e}")
-                continue
-
-            # Render widget markdown
-            try:
-                widget_markdown = widget.to_markdown(processed_data)
-                widgets_markdown.append(widget_markdown)
-
-                # Extract the actual header from widget markdown for TOC
-                # Look for first ## header
-                import re
-                header_match = re.search(r'^## (.+)$', widget_markdown, re.MULTILINE)
-                if header_match:
-                    widget_types.append(header_match.group(1))
-                else:
-                    # Fallback to widget type
-                    widget_types.append(widget_type.replace('-', ' ').replace('_', ' ').title())
-
-                # Categorize data types
-                if 'price' in widget_type or 'market' in widget_type:
-                    data_types.add('cryptocurrency')
-                elif 'news' in widget_type:
-                    data_types.add('news')
-                elif 'reddit' in widget_type or 'hackernews' in widget_type:
-                    data_types.add('social')
-                elif 'github' in widget_type or 'huggingface' in widget_type:
-                    data_types.add('repositories')
-                elif 'youtube' in widget_type:
-                    data_types.add('videos')
-                elif 'papers' in widget_type:
-                    data_types.add('research')
-
-            except Exception as e:
-                print(f"    ❌ Failed to render markdown for {widget_type}: {e}")
-                continue
-
-        # Generate page markdown
+        # Render widget markdown
         try:
-            page_markdown = generate_page_markdown(
-                page_config=page_config,
-                widgets_markdown=widgets_markdown,
-                widget_types=widget_types,
-                data_types=list(data_types),
-                base_url=base_url
-            )
+            widget_markdown = widget.to_markdown(processed_data)
+            widgets_markdown.append(widget_markdown)
+
+            # Extract the actual header from widget markdown for TOC
+            # Look for first ## header
+            header_match = _HEADER_RE.search(widget_markdown)
+            if header_match:
+                widget_types.append(header_match.group(1))
+            else:
+                # Fallback to widget type
+                widget_types.append(widget_type.replace('-', ' ').replace('_', ' ').title())
+
+            # Categorize data types
+            data_type = _data_type_for(widget_type)
+            if data_type:
+                data_types.add(data_type)
 
-            # Save page markdown to flat structure: docs/{page_id}.md
-            page_output = docs_dir / f"{page_config.id}.md"
-            with open(page_output, 'w') as f:
-                f.write(page_markdown)
+        except Exception as e:
+            log(f"    ❌ Failed to render markdown for {widget_type}: {e}")
+            continue
 
-            print(f"    ✅ Saved to {page_config.id}.md")
-            rendered_pages += 1
+    # Generate page markdown, streamed straight to docs/{page_id}.md
+    try:
+        page_chunks = iter_page_markdown(
+            page_config=page_config,
+            widgets_markdown=widgets_markdown,
+            widget_types=widget_types,
+            data_types=sorted(data_types),
+            base_url=base_url,
+            now=rendered_at,
+        )
 
-        except Exception as e:
-            print(f"    ❌ Failed to render markdown page: {e}")
-            failed_pages += 1
+        page_output = docs_dir / f"{page_config.id}.md"
+        with open(page_output, 'w') as f:
+            f.writelines(page_chunks)
 
-    # Print summary
-    print(f"\n{'='*60}")
-    print(f"📊 AI Markdown Render Summary:")
-    print(f"   ✅ Rendered: {rendered_pages} markdown pages")
-    print(f"   ❌ Failed: {failed_pages} pages")
-    print(f"   📁 Output: {docs_dir}")
-    print(f"{'='*60}\n")
+        log(f"    ✅ Saved to {page_config.id}.md")
+        return True, lines
+
+    except Exception as e:
+        log(f"    ❌ Failed to render markdown page: {e}")
+        return False, lines
 
 
 def generate_page_markdown(
@@ -179,27 +289,57 @@ def generate_page_markdown(
     widgets_markdown: list,
     widget_types: list,
     data_types: list,
-    base_url: str = None
+    base_url: str = None,
+    now: datetime = None
 ) -> str:
     """Generate comprehensive Markdown for a single page.
 
+    Joins the chunks from iter_page_markdown(); see it for the arguments.
+
+    Returns:
+        Complete markdown string for the page
+    """
+    return ''.join(iter_page_markdown(
+        page_config,
+        widgets_markdown,
+        widget_types,
+        data_types,
+        base_url=base_url,
+        now=now,
+    ))
+
+
+def iter_page_markdown(
+    page_config,
+    widgets_markdown: list,
+    widget_types: list,
+    data_types: list,
+    base_url: str = None,
+    now: datetime = None
+) -> Iterator[str]:
+    """Yield the Markdown for a single page in chunks, ready for writelines().
+
     Args:
         page_config: PageConfig object
         widgets_markdown: List of markdown strings from widgets
         widget_types: List of widget type names
         data_types: List of data type categories
         base_url: Base URL for the site
+        now: Render timestamp (default: current UTC time)
 
-    Returns:
-        Complete markdown string for the page
+    Yields:
+        Markdown chunks; widget sections are yielded as-is without copying
     """
+    if now is None:
+        now = datetime.now(timezone.utc)
+
     # Generate YAML frontmatter
     frontmatter = {
         'title': f"{page_config.name} Dashboard",
         'description': page_config.description,
         'category': page_config.category,
         'page_id': page_config.id,
-        'updated': datetime.now(timezone.utc).isoformat(),
+        'updated': now.isoformat(),
     }
 
     if base_url:
@@ -211,65 +351,40 @@ def generate_page_markdown(
     if data_types:
         frontmatter['data_types'] = data_types
 
-    # Build markdown content
-    md_parts = []
-
-    # Add frontmatter
-    md_parts.append("---")
-    md_parts.append(yaml.dump(frontmatter, default_flow_style=False, sort_keys=False).strip())
-    md_parts.append("---")
-    md_parts.append("")
-
-    # Add page header
-    md_parts.append(f"# {page_config.name} Dashboard")
-    md_parts.append("")
-    md_parts.append(page_config.description)
-    md_parts.append("")
-
-    # Add metadata (with double-space line breaks)
-    updated_time = datetime.now(timezone.utc).strftime("%B %d, %Y at %H:%M UTC")
-    md_parts.append(f"**Last Updated:** {updated_time}  ")  # Two spaces for hard line break
-
-    if base_url:
-        md_parts.append(f"**HTML Version:** [{page_config.id}.html]({base_url}/{page_config.id}.html)")
-
-    md_parts.append("")
-    md_parts.append("---")
-    md_parts.append("")
+    # Build markdown content (every chunk ends its own line)
+    # Frontmatter, page header and metadata (with double-space line break) in one block
+    html_line = (
+        f"**HTML Version:** [{page_config.id}.html]({base_url}/{page_config.id}.html)\n"
+        if base_url else ""
+    )
+    yield _PAGE_HEADER.format(
+        frontmatter=yaml.dump(frontmatter, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False).strip(),
+        name=page_config.name,
+        description=page_config.description,
+        updated=now.strftime("%B %d, %Y at %H:%M UTC"),
+        html_line=html_line,
+    )
 
     # Add table of contents
     if widget_types:
-        md_parts.append("## Table of Contents")
-        md_parts.append("")
+        yield "## Table of Contents\n\n"
         for idx, widget_title in enumerate(widget_types, 1):
             # Create anchor link from header (markdown style: lowercase, spaces->hyphens, remove special chars)
             # This matches CommonMark/GitHub behavior exactly
-            import re
-            anchor = widget_title.lower()
-            # Remove emojis and other non-ASCII characters
-            anchor = re.sub(r'[^\x00-\x7F]+', '', anchor)  # Remove non-ASCII completely
-            # Remove all punctuation except hyphens and spaces
-            anchor = re.sub(r'[^\w\s-]', '', anchor)  # Remove punctuation
-            # Replace spaces with hyphens (do NOT collapse multiple hyphens)
-            anchor = anchor.replace(' ', '-')
-            # Remove leading/trailing hyphens
-            anchor = anchor.strip('-')
-            md_parts.append(f"{idx}. [{widget_title}](#{anchor})")
-        md_parts.append("")
-        md_parts.append("---")
-        md_parts.append("")
+            # Lowercase, remove emojis and other non-ASCII characters completely, then
+            # remove punctuation and replace spaces with hyphens (do NOT collapse
+            # multiple hyphens) in one pass, and remove leading/trailing hyphens
+            anchor = widget_title.lower().encode('ascii', 'ignore').decode('ascii')
+            anchor = anchor.translate(_ANCHOR_TABLE).strip('-')
+            yield f"{idx}. [{widget_title}](#{anchor})\n"
+        yield _SECTION_RULE
 
     # Add widget sections
     for widget_md in widgets_markdown:
-        md_parts.append(widget_md)
-        md_parts.append("---")
-        md_parts.append("")
-
-    # Add footer
-    md_parts.append(f"*Generated by {PROJECT_NAME} - {PROJECT_TAGLINE}*")
-    md_parts.append("")
+        yield widget_md
+        yield _SECTION_RULE
 
-    return '\n'.join(md_parts)
+    yield _PAGE_FOOTER
 
 
 if __name__ == "__main__":
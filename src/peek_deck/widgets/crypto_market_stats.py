@@ -2,12 +2,35 @@
 from ..core.output_manager import OutputManager
 
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from ..core.base_widget import BaseWidget
 from ..core.url_fetch_manager import get_url_fetch_manager
 from ..core.utils import format_large_number
 
+# CoinGecko markets endpoint and its fixed query params (only "ids" varies per widget)
+_COINGECKO_MARKETS_URL = "https://api.coingecko.com/api/v3/coins/markets"
+_COINGECKO_MARKETS_PARAMS = {
+    "vs_currency": "usd",
+    "price_change_percentage": "24h",
+}
+
+
+def _format_display_values(
+    market_cap: float,
+    circulating_supply: Optional[float],
+    max_supply: Optional[float],
+) -> Tuple[str, str, str]:
+    """Format market cap, circulating supply and % of max supply for display.
+
+    Shared by render() and to_markdown() so both show identical strings.
+    """
+    market_cap_display = format_large_number(market_cap)
+    # Integer grouping is cheaper than float ",.0f"; round() matches its rounding
+    circulating_display = f"{round(circulating_supply):,d}" if circulating_supply else "N/A"
+    supply_percent = f"{(circulating_supply / max_supply * 100):.1f}%" if (circulating_supply and max_supply) else "N/A"
+    return market_cap_display, circulating_display, supply_percent
+
 
 class CryptoMarketStatsWidget(BaseWidget):
     """Displays cryptocurrency market statistics from CoinGecko.
@@ -27,43 +50,38 @@ class CryptoMarketStatsWidget(BaseWidget):
         client = get_url_fetch_manager()
 
         try:
-            # Fetch coin data from CoinGecko API
-            url = f"https://api.coingecko.com/api/v3/coins/{coin_id}"
-            params = {
-                "localization": "false",
-                "tickers": "false",
-                "market_data": "true",
-                "community_data": "false",
-                "developer_data": "false",
-            }
-            coin_data = client.get(url, params=params, response_type="json")
-            market_data = coin_data["market_data"]
+            # Fetch coin data from CoinGecko markets API (flat, much smaller payload than /coins/{id})
+            params = {**_COINGECKO_MARKETS_PARAMS, "ids": coin_id}
+            markets = client.get(_COINGECKO_MARKETS_URL, params=params, response_type="json")
+            if not markets:
+                raise ValueError(f"Coin '{coin_id}' not found on CoinGecko")
+            coin_data = markets[0]
 
             # Extract relevant market stats
-            current_price = market_data["current_price"]["usd"]
-            ath_price = market_data["ath"]["usd"]
-            atl_price = market_data["atl"]["usd"]
+            current_price = coin_data["current_price"]
+            ath_price = coin_data["ath"]
+            atl_price = coin_data["atl"]
 
             data = {
                 "coin_id": coin_id,
                 "name": coin_data["name"],
                 "symbol": coin_data["symbol"].upper(),
                 "current_price": current_price,
-                "market_cap": market_data["market_cap"]["usd"],
-                "total_supply": market_data.get("total_supply"),
-                "circulating_supply": market_data.get("circulating_supply"),
-                "max_supply": market_data.get("max_supply"),
+                "market_cap": coin_data["market_cap"],
+                "total_supply": coin_data.get("total_supply"),
+                "circulating_supply": coin_data.get("circulating_supply"),
+                "max_supply": coin_data.get("max_supply"),
                 "ath": {
                     "price": ath_price,
-                    "date": market_data["ath_date"]["usd"],
+                    "date": coin_data["ath_date"],
                     "change_percent": ((current_price - ath_price) / ath_price * 100) if ath_price else 0,
                 },
                 "atl": {
                     "price": atl_price,
-                    "date": market_data["atl_date"]["usd"],
+                    "date": coin_data["atl_date"],
                     "change_percent": ((current_price - atl_price) / atl_price * 100) if atl_price else 0,
                 },
-                "price_change_24h_percent": market_data.get("price_change_percentage_24h", 0),
+                "price_change_24h_percent": coin_data.get("price_change_percentage_24h", 0),
                 "market_cap_rank": coin_data.get("market_cap_rank"),
                 "fetched_at": datetime.now(timezone.utc).isoformat(),
             }
@@ -89,9 +107,9 @@ class CryptoMarketStatsWidget(BaseWidget):
         timestamp_iso = processed_data["fetched_at"]
 
         # Format values
-        market_cap_display = format_large_number(market_cap)
-        circulating_display = f"{circulating_supply:,.0f}" if circulating_supply else "N/A"
-        supply_percent = f"{(circulating_supply / max_supply * 100):.1f}%" if (circulating_supply and max_supply) else "N/A"
+        market_cap_display, circulating_display, supply_percent = _format_display_values(
+            market_cap, circulating_supply, max_supply
+        )
 
         # Pass ISO date strings for client-side formatting
         ath_date_iso = ath["date"]
@@ -133,44 +151,27 @@ class CryptoMarketStatsWidget(BaseWidget):
         atl = processed_data.get("atl", {})
 
         # Format values like HTML does
-        market_cap_display = format_large_number(market_cap)
-        circulating_display = f"{circulating_supply:,.0f}" if circulating_supply else "N/A"
-        supply_percent = f"{(circulating_supply / max_supply * 100):.1f}%" if (circulating_supply and max_supply) else "N/A"
-
-        md_parts = []
-
-        # Title (matches HTML)
-        md_parts.append(f"## {name} Market Stats")
-        md_parts.append("")
-
-        # Market Cap with Rank
-        md_parts.append(f"**Market Cap:** {market_cap_display}")
-        if market_cap_rank:
-            md_parts.append(f"Rank #{market_cap_rank}")
-        md_parts.append("")
-
-        # Circulating Supply
-        md_parts.append(f"**Circulating Supply:** {circulating_display} {symbol}")
-        if supply_percent != "N/A":
-            md_parts.append(f"{supply_percent} of max")
-        else:
-            md_parts.append("No max supply")
-        md_parts.append("")
-
-        # All-Time High
+        market_cap_display, circulating_display, supply_percent = _format_display_values(
+            market_cap, circulating_supply, max_supply
+        )
+
+        # Optional lines (each carries its own newline)
+        rank_line = f"Rank #{market_cap_rank}\n" if market_cap_rank else ""
+        supply_line = f"{supply_percent} of max" if supply_percent != "N/A" else "No max supply"
+
         ath_price = ath.get('price', 0)
         ath_change = ath.get('change_percent', 0)
         ath_sign = "" if ath_change < 0 else "+"
-        md_parts.append(f"**All-Time High:** ${ath_price:,.2f}")
-        md_parts.append(f"{ath_sign}{ath_change:.1f}%")
-        md_parts.append("")
 
-        # All-Time Low
         atl_price = atl.get('price', 0)
         atl_change = atl.get('change_percent', 0)
         atl_sign = "+" if atl_change >= 0 else ""
-        md_parts.append(f"**All-Time Low:** ${atl_price:,.2f}")
-        md_parts.append(f"{atl_sign}{atl_change:.1f}%")
-        md_parts.append("")
 
-        return '\n'.join(md_parts)
+        # Title (matches HTML), market cap with rank, circulating supply, ATH, ATL
+        return (
+            f"## {name} Market Stats\n\n"
+            f"**Market Cap:** {market_cap_display}\n{rank_line}\n"
+            f"**Circulating Supply:** {circulating_display} {symbol}\n{supply_line}\n\n"
+            f"**All-Time High:** ${ath_price:,.2f}\n{ath_sign}{ath_change:.1f}%\n\n"
+            f"**All-Time Low:** ${atl_price:,.2f}\n{atl_sign}{atl_change:.1f}%\n"
+        )
@@ -2,12 +2,34 @@
 from ..core.output_manager import OutputManager
 
 from datetime import datetime, timezone
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
 from ..core.base_widget import BaseWidget
+from ..core.memory_cache import MemoryCache
 from ..core.url_fetch_manager import get_url_fetch_manager
 from ..core.utils import format_large_number
 
+# Display names for known base currencies (others fall back to the ticker code)
+_DISPLAY_NAMES = {
+    "BTC": "Bitcoin",
+    "ETH": "Ethereum",
+    "SOL": "Solana",
+}
+
+# Ticker TTL (seconds), shared by the HTTP cache and the parsed-ticker cache
+_TICKER_TTL = 60
+
+# Parsed ticker data by lowercase symbol, so repeat fetches skip float parsing and dict building
+_parsed_tickers = MemoryCache[Dict[str, Any]](ttl_seconds=_TICKER_TTL, max_entries=256)
+
+
+@lru_cache(maxsize=256)
+def _split_symbol(symbol: str) -> Tuple[str, str, str]:
+    """Split a trading pair into (BASE, QUOTE, lowercase symbol), e.g. "btcusd" -> ("BTC", "USD", "btcusd")."""
+    lower = symbol.lower()
+    return lower[:3].upper(), lower[3:].upper(), lower
+
 
 class CryptoPriceWidget(BaseWidget):
     """Displays current cryptocurrency price from Gemini exchange.
@@ -23,28 +45,37 @@ class CryptoPriceWidget(BaseWidget):
         """Fetch current price data from Gemini."""
         self.validate_params()
 
-        symbol = self.merged_params["symbol"].lower()
+        base, quote, symbol = _split_symbol(self.merged_params["symbol"])
+
+        cached = _parsed_tickers.get(symbol)
+        if cached is not None:
+            OutputManager.log(f"✅ Using cached {cached['symbol']}: ${cached['price']:,.2f}")
+            return {**cached, "volume": dict(cached["volume"])}
+
         client = get_url_fetch_manager()
 
         try:
             # Fetch ticker data from Gemini API
             url = f"https://api.gemini.com/v1/pubticker/{symbol}"
-            ticker_data = client.get(url, response_type="json")
+            ticker_data = client.get(url, response_type="json", cache_ttl=_TICKER_TTL)
 
             # Extract relevant fields
+            volume = ticker_data["volume"]
             data = {
-                "symbol": symbol.upper(),
+                "symbol": base + quote,
                 "price": float(ticker_data["last"]),
                 "volume": {
-                    "base": float(ticker_data["volume"].get(symbol[:3].upper(), 0)),
-                    "quote": float(ticker_data["volume"].get(symbol[3:].upper(), 0)),
+                    "base": float(volume.get(base, 0)),
+                    "quote": float(volume.get(quote, 0)),
                 },
                 "bid": float(ticker_data["bid"]),
                 "ask": float(ticker_data["ask"]),
                 "fetched_at": datetime.now(timezone.utc).isoformat(),
             }
 
-            OutputManager.log(f"✅ Fetched {symbol.upper()}: ${data['price']:,.2f}")
+            _parsed_tickers.set(symbol, {**data, "volume": dict(data["volume"])})
+
+            OutputManager.log(f"✅ Fetched {data['symbol']}: ${data['price']:,.2f}")
             return data
 
         except Exception as e:
@@ -60,14 +91,7 @@ class CryptoPriceWidget(BaseWidget):
         # Format the symbol for better readability (e.g., BTCUSD -> Bitcoin Price)
         # Extract base currency (first 3 chars for most cases)
         base_currency = symbol[:3]
-        if base_currency == "BTC":
-            display_name = "Bitcoin"
-        elif base_currency == "ETH":
-            display_name = "Ethereum"
-        elif base_currency == "SOL":
-            display_name = "Solana"
-        else:
-            display_name = base_currency
+        display_name = _DISPLAY_NAMES.get(base_currency, base_currency)
 
         # Format volume in USD (quote currency volume)
         volume_usd = volume['quote']
@@ -90,29 +114,10 @@ class CryptoPriceWidget(BaseWidget):
         bid = processed_data.get("bid", 0)
         ask = processed_data.get("ask", 0)
         volume = processed_data.get("volume", {})
-        timestamp_iso = processed_data.get("fetched_at", "")
-
-        try:
-            dt = datetime.fromisoformat(timestamp_iso.replace('Z', '+00:00'))
-            timestamp_display = dt.strftime("%B %d, %Y at %H:%M UTC")
-        except:
-            timestamp_display = timestamp_iso
 
         # Get display name like HTML does
         base_currency = symbol[:3]
-        if base_currency == "BTC":
-            display_name = "Bitcoin"
-        elif base_currency == "ETH":
-            display_name = "Ethereum"
-        elif base_currency == "SOL":
-            display_name = "Solana"
-        else:
-            display_name = base_currency
-
-        md_parts = []
+        display_name = _DISPLAY_NAMES.get(base_currency, base_currency)
+
         # Match HTML: just title and large price
-        md_parts.append(f"## {display_name} Price")
-        md_parts.append("")
-        md_parts.append(f"### ${price:,.2f}")
-        md_parts.append("")
-        return '\n'.join(md_parts)
+        return f"## {display_name} Price\n\n### ${price:,.2f}\n"
@@ -170,14 +170,6 @@ class GithubReposWidget(BaseWidget):
         days = processed_data.get("days", 30)
         limit = processed_data.get("limit", 10)
         total_count = processed_data.get("total_count", 0)
-        timestamp_iso = processed_data.get("fetched_at", "")
-
-        # Parse timestamp for display
-        try:
-            dt = datetime.fromisoformat(timestamp_iso.replace('Z', '+00:00'))
-            timestamp_display = dt.strftime("%B %d, %Y at %H:%M UTC")
-        except:
-            timestamp_display = timestamp_iso
 
         md_parts = []
 
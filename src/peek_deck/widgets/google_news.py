@@ -1,15 +1,68 @@
 """Google News widget using RSS feed with rich metadata extraction."""
 from ..core.output_manager import OutputManager
 
-import xml.etree.ElementTree as ET
+import calendar
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from email.utils import parsedate_tz
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, TypedDict
 
 from ..core.base_widget import BaseWidget
+from ..core.memory_cache import MemoryCache
 from ..core.url_fetch_manager import get_url_fetch_manager
 from ..core.url_metadata import get_url_metadata_extractor
 from ..core.utils import resolve_google_news_url, format_timestamp_ago
 
+try:
+    # libxml2-backed parser; same element API as ElementTree for what we use
+    from lxml import etree as ET
+    _ITERPARSE_OPTIONS = {"resolve_entities": False, "no_network": True}
+except ImportError:  # pragma: no cover - optional dependency
+    import xml.etree.ElementTree as ET
+    _ITERPARSE_OPTIONS = {}
+
+# Concurrent Google News redirect resolutions per widget (requests are still
+# rate limited by the shared token bucket in core.utils)
+_RESOLVE_WORKERS = 8
+
+# RSS <item> child tags read by fetch_data
+_ITEM_FIELDS = frozenset(('title', 'link', 'pubDate', 'source'))
+
+# Feed TTL (seconds), shared by the HTTP cache and the parsed-article cache
+_FEED_TTL = 300
+
+# Parsed articles (before metadata enrichment) by (search_query, locale, region, limit)
+_parsed_feeds = MemoryCache[List["Article"]](ttl_seconds=_FEED_TTL, max_entries=128)
+
+
+class Article(TypedDict):
+    """A single Google News article as stored in raw/processed widget data."""
+
+    headline: str
+    source: str
+    source_url: str
+    url: str  # Google News redirect URL
+    pub_date: Optional[float]
+    article_url: Optional[str]  # Resolved final article URL
+    image: Optional[str]
+    description: Optional[str]
+
+
+def _iter_feed_items(xml_data: bytes) -> Iterator[Any]:
+    """Stream <item> elements out of an RSS document as each one is fully parsed.
+
+    Parsing stops as soon as the caller stops iterating, and each item is
+    cleared once the caller is done with it, so only the items actually
+    read are ever materialized.
+    """
+    for _, elem in ET.iterparse(io.BytesIO(xml_data), events=('end',), **_ITERPARSE_OPTIONS):
+        if elem.tag == 'item':
+            yield elem
+            elem.clear()
+
 
 class GoogleNewsWidget(BaseWidget):
     """Displays recent news articles from Google News RSS feed with rich metadata.
@@ -49,102 +102,46 @@ class GoogleNewsWidget(BaseWidget):
         search_query = f"{query} site:{site}" if site else query
 
         try:
-            # Fetch RSS feed from Google News
-            url = "https://news.google.com/rss/search"
-            params = {
-                "q": search_query,
-                "hl": locale,
-                "gl": region,
-                "ceid": f"{region}:en"
-            }
-            xml_data = client.get(url, params=params, response_type="text")
-
-            # Parse XML
-            root = ET.fromstring(xml_data)
-            items = root.findall('.//item')
-
-            # Extract articles
-            articles = []
-            for item in items[:limit]:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-                pub_date_elem = item.find('pubDate')
-                source_elem = item.find('source')
-
-                if title_elem is None or link_elem is None:
-                    continue
-
-                # Parse title - format is "Headline - Source"
-                title_text = title_elem.text
-                if ' - ' in title_text:
-                    # Split only on last ' - ' to preserve dashes in headline
-                    parts = title_text.rsplit(' - ', 1)
-                    headline = parts[0]
-                    source_from_title = parts[1] if len(parts) > 1 else ""
-                else:
-                    headline = title_text
-                    source_from_title = ""
-
-                # Prefer source element over title parsing
-                source_name = source_elem.text if source_elem is not None else source_from_title
-                source_url = source_elem.get('url', '') if source_elem is not None else ''
-
-                # Parse publication date (RFC 822 format)
-                pub_date_str = pub_date_elem.text if pub_date_elem is not None else None
-                pub_date_timestamp = None
-                if pub_date_str:
-                    try:
-                        # Parse RFC 822 date: "Wed, 19 Nov 2025 08:43:00 GMT"
-                        # Remove timezone string and parse as UTC
-                        date_part = pub_date_str.rsplit(' ', 1)[0]  # Remove "GMT" or other TZ
-                        dt = datetime.strptime(date_part, "%a, %d %b %Y %H:%M:%S")
-                        # Treat as UTC and convert to Unix timestamp
-                        dt_utc = dt.replace(tzinfo=timezone.utc)
-                        pub_date_timestamp = dt_utc.timestamp()
-                    except (ValueError, AttributeError):
-                        pass
-
-                articles.append({
-                    "headline": headline,
-                    "source": source_name,
-                    "source_url": source_url,
-                    "url": link_elem.text,  # Google News redirect URL
-                    "pub_date": pub_date_timestamp,
-
-                    # Metadata fields (populated below if enabled)
-                    "article_url": None,  # Resolved final article URL
-                    "image": None,
-                    "description": None,
-                })
+            feed_key = (search_query, locale, region, limit)
+            cached = _parsed_feeds.get(feed_key)
+            if cached is not None:
+                # Copy so metadata enrichment below never touches the cached articles
+                articles = [dict(article) for article in cached]
+            else:
+                articles = self._fetch_articles(client, search_query, locale, region, limit)
+                _parsed_feeds.set(feed_key, [dict(article) for article in articles])
 
             OutputManager.log(f"✅ Fetched {len(articles)} news articles for '{search_query}'")
 
             # Resolve URLs and extract rich metadata
             if extract_meta and articles:
                 OutputManager.log(f"🔗 Resolving Google News redirect URLs...")
-
-                # Step 1: Resolve all Google News redirect URLs
-                for i, article in enumerate(articles):
-                    google_url = article['url']
-                    resolved_url = resolve_google_news_url(google_url, timeout=10)
-
-                    if resolved_url != google_url:
-                        article['article_url'] = resolved_url
-                        OutputManager.log(f"   {i+1}/{len(articles)}: Resolved")
-                    else:
-                        OutputManager.log(f"   {i+1}/{len(articles)}: Failed to resolve")
-
-                # Step 2: Extract metadata from resolved URLs
-                OutputManager.log(f"📸 Extracting metadata from article URLs...")
+                OutputManager.log(f"📸 Extracting metadata from article URLs as they resolve...")
                 extractor = get_url_metadata_extractor()
 
-                for i, article in enumerate(articles):
-                    if not article['article_url']:
-                        continue
-
-                    # Extract metadata from resolved article URL (only image and description)
-                    metadata = extractor.extract(article['article_url'])
-
+                # Pipeline: resolve redirects concurrently (rate limited) and start each
+                # article's metadata extraction as soon as its URL resolves
+                metadata_futures = []
+                with ThreadPoolExecutor(max_workers=min(_RESOLVE_WORKERS, len(articles))) as pool:
+                    resolve_futures = {
+                        pool.submit(resolve_google_news_url, article['url'], timeout=10): i
+                        for i, article in enumerate(articles)
+                    }
+                    for future in as_completed(resolve_futures):
+                        i = resolve_futures[future]
+                        article = articles[i]
+                        resolved_url = future.result()
+
+                        if resolved_url != article['url']:
+                            article['article_url'] = resolved_url
+                            # Only image and description are used from the metadata
+                            metadata_futures.append((article, extractor.submit(resolved_url)))
+                            OutputManager.debug("   %d/%d: Resolved", i + 1, len(articles))
+                        else:
+                            OutputManager.debug("   %d/%d: Failed to resolve", i + 1, len(articles))
+
+                for article, future in metadata_futures:
+                    metadata = future.result()
                     if metadata:
                         article['image'] = metadata.image
                         article['description'] = metadata.description
@@ -171,6 +168,75 @@ class GoogleNewsWidget(BaseWidget):
             OutputManager.log(f"❌ Failed to fetch or parse Google News for '{search_query}': {e}")
             raise
 
+    def _fetch_articles(self, client, search_query: str, locale: str, region: str, limit: int) -> List[Article]:
+        """Fetch the Google News RSS feed and parse up to limit articles (without metadata)."""
+        # Fetch RSS feed from Google News
+        url = "https://news.google.com/rss/search"
+        params = {
+            "q": search_query,
+            "hl": locale,
+            "gl": region,
+            "ceid": f"{region}:en"
+        }
+        # Raw bytes: let the XML parser honour the feed's declared encoding
+        xml_data = client.get(url, params=params, response_type="binary", cache_ttl=_FEED_TTL)
+
+        # Stream items and stop parsing once limit items are seen
+        articles: List[Article] = []
+        for item in islice(_iter_feed_items(xml_data), limit):
+            # Single pass over the item's children (first occurrence wins, like find())
+            fields = {}
+            for child in item:
+                if child.tag in _ITEM_FIELDS and child.tag not in fields:
+                    fields[child.tag] = child
+
+            title_elem = fields.get('title')
+            link_elem = fields.get('link')
+            pub_date_elem = fields.get('pubDate')
+            source_elem = fields.get('source')
+
+            if title_elem is None or link_elem is None:
+                continue
+
+            # Parse title - format is "Headline - Source"
+            # Split only on last ' - ' to preserve dashes in headline
+            title_text = title_elem.text
+            head, sep, tail = title_text.rpartition(' - ')
+            headline = head if sep else title_text
+            source_from_title = tail if sep else ""
+
+            # Prefer source element over title parsing
+            source_name = source_elem.text if source_elem is not None else source_from_title
+            source_url = source_elem.get('url', '') if source_elem is not None else ''
+
+            # Parse publication date (RFC 822 format)
+            pub_date_str = pub_date_elem.text if pub_date_elem is not None else None
+            pub_date_timestamp = None
+            if pub_date_str:
+                # Parse RFC 822 date: "Wed, 19 Nov 2025 08:43:00 GMT"
+                parsed = parsedate_tz(pub_date_str)
+                if parsed is not None:
+                    try:
+                        # Pure UTC epoch math; a missing zone is treated as UTC
+                        pub_date_timestamp = float(calendar.timegm(parsed[:9]) - (parsed[9] or 0))
+                    except (TypeError, ValueError, OverflowError):
+                        pass
+
+            articles.append(Article(
+                headline=headline,
+                source=source_name,
+                source_url=source_url,
+                url=link_elem.text,
+                pub_date=pub_date_timestamp,
+
+                # Metadata fields (populated by fetch_data if enabled)
+                article_url=None,
+                image=None,
+                description=None,
+            ))
+
+        return articles
+
     def render(self, processed_data: Dict[str, Any]) -> str:
         """Render Google News widget HTML."""
         title = processed_data["title"]
@@ -199,36 +265,24 @@ class GoogleNewsWidget(BaseWidget):
         site = processed_data.get("site")
         search_query = processed_data.get("search_query", query)
         articles = processed_data.get("articles", [])
-        timestamp_iso = processed_data.get("fetched_at", "")
-
-        # Parse timestamp for display
-        try:
-            dt = datetime.fromisoformat(timestamp_iso.replace('Z', '+00:00'))
-            timestamp_display = dt.strftime("%B %d, %Y at %H:%M UTC")
-        except:
-            timestamp_display = timestamp_iso
-
-        md_parts = []
 
         # Widget header (match HTML: title and query on same line)
-        md_parts.append(f"## {title}: \"{search_query}\"")
-        md_parts.append("")
+        md_parts = [f"## {title}: \"{search_query}\"\n"]
+
+        # One clock read for every relative time in this render
+        now = time.time()
 
+        # Each article block opens with the blank line separating it from the previous one
         for idx, article in enumerate(articles, 1):
             # Title with link (matches HTML)
             headline = article['headline']
             # Use resolved article_url if available, otherwise Google News URL
             url = article.get('article_url') or article.get('url', '')
-            if url:
-                md_parts.append(f"**[{headline}]({url})**")
-            else:
-                md_parts.append(f"**{headline}**")
-            md_parts.append("")
+            title_line = f"**[{headline}]({url})**" if url else f"**{headline}**"
 
             # Description (full, not truncated - key difference for AI)
-            if article.get('description'):
-                md_parts.append(article['description'])
-                md_parts.append("")
+            description = article.get('description')
+            desc_block = f"\n{description}\n" if description else ""
 
             # Source and time (matches HTML footer)
             footer_parts = []
@@ -237,14 +291,12 @@ class GoogleNewsWidget(BaseWidget):
 
             # Add publication time if available
             if article.get('pub_date'):
-                time_str = format_timestamp_ago(article['pub_date'])
+                time_str = format_timestamp_ago(article['pub_date'], now=now)
                 if time_str:
                     footer_parts.append(time_str)
 
-            if footer_parts:
-                md_parts.append(" • ".join(footer_parts))
-                md_parts.append("")
-            md_parts.append("---")
-            md_parts.append("")
+            footer_block = f"\n{' • '.join(footer_parts)}\n" if footer_parts else ""
+
+            md_parts.append(f"\n{title_line}\n{desc_block}{footer_block}\n---\n")
 
-        return '\n'.join(md_parts)
+        return ''.join(md_parts)
@@ -2,7 +2,7 @@
 from ..core.output_manager import OutputManager
 
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, TypedDict
 from urllib.parse import urlparse
 import time
 
@@ -12,6 +12,23 @@ from ..core.url_metadata import get_url_metadata_extractor
 from ..core.utils import get_favicon_url, format_time_ago
 
 
+class HNPost(TypedDict):
+    """A single HackerNews post as stored in raw/processed widget data."""
+
+    title: str
+    url: str
+    hn_url: str
+    author: str
+    points: int
+    num_comments: int
+    created_at: str
+    object_id: str
+    image: Optional[str]
+    description: Optional[str]
+    favicon: Optional[str]
+    site_name: Optional[str]
+
+
 class HackernewsPostsWidget(BaseWidget):
     """Displays recent posts from HackerNews search with rich metadata.
 
@@ -72,29 +89,31 @@ class HackernewsPostsWidget(BaseWidget):
             if filters:
                 params["numericFilters"] = ",".join(filters)
 
-            hn_data = client.get(base_url, params=params, response_type="json")
+            hn_data = client.get(base_url, params=params, response_type="json", cache_ttl=300)
 
             # Extract posts from HN API response
-            posts = []
+            posts: List[HNPost] = []
             for hit in hn_data["hits"]:
-                post_url = hit.get("url", f"https://news.ycombinator.com/item?id={hit['objectID']}")
-
-                posts.append({
-                    "title": hit["title"],
-                    "url": post_url,
-                    "hn_url": f"https://news.ycombinator.com/item?id={hit['objectID']}",
-                    "author": hit["author"],
-                    "points": hit["points"],
-                    "num_comments": hit["num_comments"],
-                    "created_at": hit["created_at"],
-                    "object_id": hit["objectID"],
+                hn_url = f"https://news.ycombinator.com/item?id={hit['objectID']}"
+                # Text posts (Ask HN etc.) have no url, or a null one: link to the discussion
+                post_url = hit.get("url") or hn_url
+
+                posts.append(HNPost(
+                    title=hit["title"],
+                    url=post_url,
+                    hn_url=hn_url,
+                    author=hit["author"],
+                    points=hit["points"],
+                    num_comments=hit["num_comments"],
+                    created_at=hit["created_at"],
+                    object_id=hit["objectID"],
 
                     # Metadata fields (populated below)
-                    "image": None,
-                    "description": None,
-                    "favicon": None,
-                    "site_name": None,
-                })
+                    image=None,
+                    description=None,
+                    favicon=None,
+                    site_name=None,
+                ))
 
             # Enforce limit - defensive check in case API returns more than requested
             if len(posts) > limit:
@@ -108,13 +127,25 @@ class HackernewsPostsWidget(BaseWidget):
 
                 extractor = get_url_metadata_extractor()
 
-                for i, post in enumerate(posts):
-                    # Only extract metadata for external links (not HN discussion pages)
+                # Only extract metadata for external links (not HN discussion pages),
+                # skipping URLs that recently yielded no metadata at all
+                external_posts = []
+                for post in posts:
                     if post['url'] == post['hn_url']:
                         continue
+                    if extractor.is_known_empty(post['url']):
+                        # Same result as empty metadata: fall back to cleaned domain
+                        domain = urlparse(post['url']).netloc.lower()
+                        if domain:
+                            post['site_name'] = domain.replace('www.', '')
+                        continue
+                    external_posts.append(post)
+
+                # Extract metadata from article URLs concurrently (uses 30-day cache, very fast)
+                metadata_by_url = extractor.extract_batch([post['url'] for post in external_posts])
 
-                    # Extract metadata from article URL (uses 30-day cache, very fast)
-                    metadata = extractor.extract(post['url'])
+                for post in external_posts:
+                    metadata = metadata_by_url.get(post['url'])
 
                     if metadata:
                         # Add rich preview data
@@ -193,14 +224,6 @@ class HackernewsPostsWidget(BaseWidget):
         days = processed_data.get("days")
         posts = processed_data.get("posts", [])
         total_hits = processed_data.get("total_hits", 0)
-        timestamp_iso = processed_data.get("fetched_at", "")
-
-        # Parse timestamp for display
-        try:
-            dt = datetime.fromisoformat(timestamp_iso.replace('Z', '+00:00'))
-            timestamp_display = dt.strftime("%B %d, %Y at %H:%M UTC")
-        except:
-            timestamp_display = timestamp_iso
 
         md_parts = []
 
@@ -2,13 +2,81 @@
 from ..core.output_manager import OutputManager
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from itertools import islice
+from typing import Any, Dict, List, Optional, TypedDict
 
 from ..core.base_widget import BaseWidget
 from ..core.url_fetch_manager import get_url_fetch_manager
 from ..core.utils import format_time_ago
 
 
+class Paper(TypedDict):
+    """A single HuggingFace daily paper as stored in raw/processed widget data."""
+
+    id: str
+    title: str
+    authors: str  # First 3 names, plus "et al. (N authors)" when longer
+    organization_name: Optional[str]
+    organization_fullname: Optional[str]
+    organization_avatar: Optional[str]
+    summary: str
+    ai_summary: str
+    hf_url: str
+    arxiv_url: str
+    thumbnail: str
+    upvotes: int
+    num_comments: int
+    published_at: Optional[str]
+    github_repo: Optional[str]
+    github_stars: Optional[int]
+    project_page: Optional[str]
+
+
+def _render_paper_block(paper: Paper) -> str:
+    """Render one paper as a markdown block (opens with its separating blank line)."""
+    # Title with link to HuggingFace paper page (matches HTML)
+    title = paper['title']
+    hf_url = paper.get('hf_url', '')
+    title_line = f"**[{title}]({hf_url})**" if hf_url else f"**{title}**"
+
+    # Organization (matches HTML)
+    org = paper.get('organization_fullname')
+    org_block = f"\n🏢 {org}\n" if org else ""
+
+    # Summary - show ai_summary OR full summary, not both (matches HTML)
+    # Don't truncate - this is the key difference for AI consumption
+    summary = paper.get('ai_summary') or paper.get('summary')
+    summary_block = f"\n{summary}\n" if summary else "\n"
+
+    # Stats and links (matches HTML footer)
+    stats_parts = [f"▲ {paper.get('upvotes', 0)}", f"💬 {paper.get('num_comments', 0)}"]
+    if paper.get('github_stars'):
+        stats_parts.append(f"⭐ {paper['github_stars']:,}")
+
+    # Add publication time if available
+    if paper.get('published_at'):
+        time_str = format_time_ago(paper['published_at'])
+        if time_str:
+            stats_parts.append(time_str)
+
+    # Links row (matches HTML)
+    links_parts = [f"[🎓 arXiv]({paper['arxiv_url']})"]
+    if paper.get('github_repo'):
+        links_parts.append(f"[💻 code]({paper['github_repo']})")
+    if paper.get('project_page'):
+        links_parts.append(f"[🔗 project]({paper['project_page']})")
+
+    return (
+        f"\n{title_line}\n"
+        f"\n*{paper['authors']}*\n"
+        f"{org_block}"
+        f"{summary_block}"
+        f"\n{' • '.join(stats_parts)}\n"
+        f"\n{' • '.join(links_parts)}\n"
+        f"\n---\n"
+    )
+
+
 class HuggingfacePapersWidget(BaseWidget):
     """Displays daily AI research papers from HuggingFace.
 
@@ -38,17 +106,18 @@ class HuggingfacePapersWidget(BaseWidget):
 
             response = client.get(url, params=params, response_type="json")
 
-            # Extract papers from response
-            papers = []
-            for item in response:
+            # Extract papers from response (the API may return more than requested,
+            # so stop once limit papers are built)
+            papers: List[Paper] = []
+            for item in islice(response, limit):
                 # Paper data is nested inside "paper" key
                 paper = item.get("paper", {})
 
-                # Extract author names
-                authors = [author.get("name", "") for author in paper.get("authors", [])]
-                author_str = ", ".join(authors[:3])  # Show first 3 authors
-                if len(authors) > 3:
-                    author_str += f" et al. ({len(authors)} authors)"
+                # Extract author names (only the first 3 are shown)
+                raw_authors = paper.get("authors") or ()
+                author_str = ", ".join(author.get("name", "") for author in raw_authors[:3])
+                if len(raw_authors) > 3:
+                    author_str += f" et al. ({len(raw_authors)} authors)"
 
                 # Extract organization info (if available)
                 org = item.get("organization") or paper.get("organization")
@@ -63,29 +132,25 @@ class HuggingfacePapersWidget(BaseWidget):
                 # Use root-level fields which have some duplicates
                 paper_id = paper["id"]
 
-                papers.append({
-                    "id": paper_id,
-                    "title": item.get("title") or paper.get("title"),
-                    "authors": author_str,
-                    "organization_name": org_name,
-                    "organization_fullname": org_fullname,
-                    "organization_avatar": org_avatar,
-                    "summary": item.get("summary") or paper.get("summary", ""),
-                    "ai_summary": paper.get("ai_summary", ""),  # Concise AI-generated summary
-                    "hf_url": f"https://huggingface.co/papers/{paper_id}",  # Primary link
-                    "arxiv_url": f"https://arxiv.org/abs/{paper_id}",  # Secondary link
-                    "thumbnail": item.get("thumbnail", ""),  # Paper preview image
-                    "upvotes": paper.get("upvotes", 0),
-                    "num_comments": item.get("numComments", 0),
-                    "published_at": item.get("publishedAt") or paper.get("publishedAt"),
-                    "github_repo": paper.get("githubRepo"),
-                    "github_stars": paper.get("githubStars"),
-                    "project_page": paper.get("projectPage"),
-                })
-
-            # Enforce limit - defensive check in case API returns more than requested
-            if len(papers) > limit:
-                papers = papers[:limit]
+                papers.append(Paper(
+                    id=paper_id,
+                    title=item.get("title") or paper.get("title"),
+                    authors=author_str,
+                    organization_name=org_name,
+                    organization_fullname=org_fullname,
+                    organization_avatar=org_avatar,
+                    summary=item.get("summary") or paper.get("summary", ""),
+                    ai_summary=paper.get("ai_summary", ""),  # Concise AI-generated summary
+                    hf_url=f"https://huggingface.co/papers/{paper_id}",  # Primary link
+                    arxiv_url=f"https://arxiv.org/abs/{paper_id}",  # Secondary link
+                    thumbnail=item.get("thumbnail", ""),  # Paper preview image
+                    upvotes=paper.get("upvotes", 0),
+                    num_comments=item.get("numComments", 0),
+                    published_at=item.get("publishedAt") or paper.get("publishedAt"),
+                    github_repo=paper.get("githubRepo"),
+                    github_stars=paper.get("githubStars"),
+                    project_page=paper.get("projectPage"),
+                ))
 
             data = {
                 "papers": papers,
@@ -121,75 +186,9 @@ class HuggingfacePapersWidget(BaseWidget):
         papers = processed_data["papers"]
         limit = processed_data.get("limit", 10)
         sort = processed_data.get("sort", "trending")
-        timestamp_iso = processed_data.get("fetched_at", "")
-
-        # Parse timestamp for display
-        try:
-            from datetime import datetime
-            dt = datetime.fromisoformat(timestamp_iso.replace('Z', '+00:00'))
-            timestamp_display = dt.strftime("%B %d, %Y at %H:%M UTC")
-        except:
-            timestamp_display = timestamp_iso
-
-        md_parts = []
 
         # Widget header (match HTML: title and sort indicator on same line)
         sort_indicator = "🔥 Trending" if sort == "trending" else "📅 Latest"
-        md_parts.append(f"## HuggingFace Papers: {sort_indicator}")
-        md_parts.append("")
-
-        for idx, paper in enumerate(papers, 1):
-            # Title with link to HuggingFace paper page (matches HTML)
-            title = paper['title']
-            hf_url = paper.get('hf_url', '')
-            if hf_url:
-                md_parts.append(f"**[{title}]({hf_url})**")
-            else:
-                md_parts.append(f"**{title}**")
-            md_parts.append("")
-
-            # Authors (matches HTML)
-            md_parts.append(f"*{paper['authors']}*")
-            md_parts.append("")
-
-            # Organization (matches HTML)
-            if paper.get('organization_fullname'):
-                md_parts.append(f"🏢 {paper['organization_fullname']}")
-                md_parts.append("")
-
-            # Summary - show ai_summary OR full summary, not both (matches HTML)
-            # Don't truncate - this is the key difference for AI consumption
-            if paper.get('ai_summary'):
-                md_parts.append(paper['ai_summary'])
-            elif paper.get('summary'):
-                md_parts.append(paper['summary'])
-            md_parts.append("")
-
-            # Stats and links (matches HTML footer)
-            stats_parts = []
-            stats_parts.append(f"▲ {paper.get('upvotes', 0)}")
-            stats_parts.append(f"💬 {paper.get('num_comments', 0)}")
-            if paper.get('github_stars'):
-                stats_parts.append(f"⭐ {paper['github_stars']:,}")
-
-            # Add publication time if available
-            if paper.get('published_at'):
-                time_str = format_time_ago(paper['published_at'])
-                if time_str:
-                    stats_parts.append(time_str)
-
-            md_parts.append(" • ".join(stats_parts))
-            md_parts.append("")
-
-            # Links row (matches HTML)
-            links_parts = [f"[🎓 arXiv]({paper['arxiv_url']})"]
-            if paper.get('github_repo'):
-                links_parts.append(f"[💻 code]({paper['github_repo']})")
-            if paper.get('project_page'):
-                links_parts.append(f"[🔗 project]({paper['project_page']})")
-            md_parts.append(" • ".join(links_parts))
-            md_parts.append("")
-            md_parts.append("---")
-            md_parts.append("")
-
-        return '\n'.join(md_parts)
+        header = f"## HuggingFace Papers: {sort_indicator}\n"
+
+        return header + ''.join(_render_paper_block(paper) for paper in papers)
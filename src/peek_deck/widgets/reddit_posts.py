@@ -2,16 +2,70 @@
 from ..core.output_manager import OutputManager
 
 import html
+import io
 import re
+import time
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
-from typing import Any, Dict, List
-from urllib.parse import urlparse
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, TypedDict
 
 from ..core.base_widget import BaseWidget
 from ..core.url_fetch_manager import get_url_fetch_manager
 from ..core.url_metadata import get_url_metadata_extractor
-from ..core.utils import format_timestamp_ago
+from ..core.utils import extract_domain, format_timestamp_ago
+
+# Patterns for cleaning RSS entry content (compiled once, used per entry)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+_HREF_LINK_RE = re.compile(r'<a href="([^"]+)">\[link\]</a>')
+
+# Link hosts that are Reddit itself: exact matches, or subdomains on a dot boundary
+# (so old.reddit.com counts but notreddit.com doesn't)
+_REDDIT_HOSTS = ('reddit.com', 'redd.it')
+_REDDIT_SUBDOMAIN_SUFFIXES = tuple('.' + host for host in _REDDIT_HOSTS)
+
+# Clark-notation tags ({namespace}name), so lookups skip prefix/namespace-map resolution
+_ATOM = '{http://www.w3.org/2005/Atom}'
+_MEDIA = '{http://search.yahoo.com/mrss/}'
+_ATOM_ENTRY = _ATOM + 'entry'
+_Q_TITLE = _ATOM + 'title'
+_Q_LINK = _ATOM + 'link'
+_Q_AUTHOR_NAME = _ATOM + 'author/' + _ATOM + 'name'
+_Q_PUBLISHED = _ATOM + 'published'
+_Q_MEDIA_THUMB = _MEDIA + 'thumbnail'
+_Q_CONTENT = _ATOM + 'content'
+
+
+def _needs_description(description: Optional[str]) -> bool:
+    """Check if RSS content is too short to stand in for the linked page's description."""
+    return not description or len(description) < 50
+
+
+class Post(TypedDict):
+    """A single Reddit post as stored in raw/processed widget data."""
+
+    title: str
+    author: str
+    url: str
+    published: Optional[float]
+    thumbnail: Optional[str]
+    external_url: Optional[str]
+    site_name: Optional[str]
+    favicon: Optional[str]
+    description: Optional[str]
+
+
+def _iter_feed_entries(xml_data: str) -> Iterator[ET.Element]:
+    """Stream Atom <entry> elements as each one is fully parsed.
+
+    Parsing stops as soon as the caller stops iterating, and each entry is
+    cleared once the caller is done with it.
+    """
+    for _, elem in ET.iterparse(io.StringIO(xml_data), events=('end',)):
+        if elem.tag == _ATOM_ENTRY:
+            yield elem
+            elem.clear()
 
 
 class RedditPostsWidget(BaseWidget):
@@ -40,23 +94,20 @@ class RedditPostsWidget(BaseWidget):
             url = f"https://www.reddit.com/r/{subreddit}/rising.rss"
             xml_data = client.get(url, response_type="text")
 
-            # Parse XML (Atom format)
-            root = ET.fromstring(xml_data)
-            ns = {'atom': 'http://www.w3.org/2005/Atom', 'media': 'http://search.yahoo.com/mrss/'}
-            entries = root.findall('atom:entry', ns)
-
             # Get metadata extractor for external URLs
             metadata_extractor = get_url_metadata_extractor()
 
-            # Extract posts
-            posts = []
-            for entry in entries[:limit]:
-                title_elem = entry.find('atom:title', ns)
-                link_elem = entry.find('atom:link', ns)
-                author_elem = entry.find('atom:author/atom:name', ns)
-                published_elem = entry.find('atom:published', ns)
-                thumbnail_elem = entry.find('media:thumbnail', ns)
-                content_elem = entry.find('atom:content', ns)
+            # Extract posts, remembering which ones link to an external site
+            # (entries are streamed, so parsing stops once limit entries are seen)
+            posts: List[Post] = []
+            linked_posts = []
+            for entry in islice(_iter_feed_entries(xml_data), limit):
+                title_elem = entry.find(_Q_TITLE)
+                link_elem = entry.find(_Q_LINK)
+                author_elem = entry.find(_Q_AUTHOR_NAME)
+                published_elem = entry.find(_Q_PUBLISHED)
+                thumbnail_elem = entry.find(_Q_MEDIA_THUMB)
+                content_elem = entry.find(_Q_CONTENT)
 
                 if title_elem is None or link_elem is None:
                     continue
@@ -91,64 +142,80 @@ class RedditPostsWidget(BaseWidget):
 
                     # Extract text content from HTML (strip tags)
                     # Remove HTML tags and decode HTML entities
-                    text_content = re.sub(r'<[^>]+>', '', content_html)
+                    text_content = _TAG_RE.sub('', content_html)
                     text_content = html.unescape(text_content)
-                    text_content = text_content.strip()
 
-                    # Clean up common patterns
-                    text_content = re.sub(r'\s+', ' ', text_content)  # Normalize whitespace
-                    text_content = re.sub(r'\[link\]', '', text_content)  # Remove [link] text
-                    text_content = re.sub(r'submitted by.*', '', text_content)  # Remove "submitted by" footer
+                    # Clean up common patterns: one regex pass to normalize whitespace
+                    # (which also removes every newline), then plain string ops
+                    text_content = _WS_RE.sub(' ', text_content)
+                    if '[link]' in text_content:
+                        text_content = text_content.replace('[link]', '')  # Remove [link] text
+                    footer_start = text_content.find('submitted by')
+                    if footer_start >= 0:
+                        text_content = text_content[:footer_start]  # Remove "submitted by" footer
                     text_content = text_content.strip()
 
                     # Use RSS content as description
                     if text_content:
                         description = text_content
 
-                    # Look for external links in the content
-                    link_match = re.search(r'<a href="([^"]+)">\[link\]</a>', content_html)
+                    # Look for external links in the content (self posts have no
+                    # [link] anchor, so skip the regex scan for them)
+                    link_match = _HREF_LINK_RE.search(content_html) if '[link]' in content_html else None
                     if link_match:
-                        url = link_match.group(1)
-                        url = url.replace('&amp;', '&')
+                        # Decode every HTML entity in the href, not just &amp;
+                        url = html.unescape(link_match.group(1))
 
-                        # Parse domain
-                        parsed = urlparse(url)
-                        domain = parsed.netloc.lower()
+                        # Parse domain (single regex match, no full urlparse)
+                        domain = extract_domain(url).lower()
 
                         # Only fetch metadata for non-Reddit URLs
-                        if domain and not any(reddit_domain in domain for reddit_domain in ['reddit.com', 'redd.it']):
+                        if domain and not (
+                            domain in _REDDIT_HOSTS or domain.endswith(_REDDIT_SUBDOMAIN_SUFFIXES)
+                        ):
                             external_url = url
 
-                            # Fetch metadata from external website for site_name and favicon only
-                            try:
-                                metadata = metadata_extractor.extract(external_url)
-                                if metadata:
-                                    # Get site name (prefer og:site_name, fallback to domain)
-                                    site_name = metadata.site_name
-                                    if not site_name:
-                                        # Clean up domain as fallback
-                                        site_name = domain.replace('www.', '')
-
-                                    # Get favicon
-                                    favicon = metadata.favicon
-
-                                    # Use external site description if RSS content is too short
-                                    if metadata.description and (not description or len(description) < 50):
-                                        description = metadata.description
-                            except Exception as e:
-                                OutputManager.log(f"⚠️  Failed to fetch metadata for {external_url}: {e}")
-
-                posts.append({
-                    "title": title_elem.text,
-                    "author": author,
-                    "url": link_elem.get('href', ''),
-                    "published": published_timestamp,
-                    "thumbnail": thumbnail,
-                    "external_url": external_url,
-                    "site_name": site_name,
-                    "favicon": favicon,
-                    "description": description,
-                })
+                post = Post(
+                    title=title_elem.text,
+                    author=author,
+                    url=link_elem.get('href', ''),
+                    published=published_timestamp,
+                    thumbnail=thumbnail,
+                    external_url=external_url,
+                    site_name=site_name,
+                    favicon=favicon,
+                    description=description,
+                )
+                posts.append(post)
+                if external_url:
+                    linked_posts.append((post, domain))
+
+            # Fetch metadata from external websites concurrently, only for posts whose
+            # RSS content is too short to serve as the description. The rest show the
+            # cleaned domain as site name and no favicon (the template has a fallback icon).
+            pending_posts = []
+            for post, domain in linked_posts:
+                if _needs_description(post['description']):
+                    pending_posts.append((post, domain))
+                else:
+                    post['site_name'] = domain.removeprefix('www.')
+
+            if pending_posts:
+                metadata_by_url = metadata_extractor.extract_batch(
+                    [post['external_url'] for post, _ in pending_posts]
+                )
+                for post, domain in pending_posts:
+                    metadata = metadata_by_url.get(post['external_url'])
+                    if metadata:
+                        # Get site name (prefer og:site_name, fallback to cleaned domain)
+                        post['site_name'] = metadata.site_name or domain.removeprefix('www.')
+
+                        # Get favicon
+                        post['favicon'] = metadata.favicon
+
+                        # Use external site description if RSS content is too short
+                        if metadata.description:
+                            post['description'] = metadata.description
 
             data = {
                 "subreddit": subreddit,
@@ -180,53 +247,41 @@ class RedditPostsWidget(BaseWidget):
         """Convert Reddit posts data to markdown format."""
         subreddit = processed_data.get("subreddit", "")
         posts = processed_data.get("posts", [])
-        timestamp_iso = processed_data.get("fetched_at", "")
-
-        # Parse timestamp for display
-        try:
-            dt = datetime.fromisoformat(timestamp_iso.replace('Z', '+00:00'))
-            timestamp_display = dt.strftime("%B %d, %Y at %H:%M UTC")
-        except:
-            timestamp_display = timestamp_iso
-
-        md_parts = []
 
         # Widget header (match HTML: title with subreddit)
-        md_parts.append(f"## Reddit: r/{subreddit}")
-        md_parts.append("")
+        md_parts = [f"## Reddit: r/{subreddit}\n"]
+
+        # One clock read for every relative time in this render
+        now = time.time()
 
+        # Each post block opens with the blank line separating it from the previous one
         for idx, post in enumerate(posts, 1):
             # Title with link (matches HTML)
             title = post['title']
             url = post.get('url', '')
-            if url:
-                md_parts.append(f"**[{title}]({url})**")
-            else:
-                md_parts.append(f"**{title}**")
-            md_parts.append("")
+            title_line = f"**[{title}]({url})**" if url else f"**{title}**"
 
             # Description (full, not truncated - key difference for AI)
-            if post.get('description'):
-                md_parts.append(post['description'])
-                md_parts.append("")
+            description = post.get('description')
+            desc_block = f"\n{description}\n" if description else ""
+
+            # Footer with source and time (matches HTML), reading each field once
+            external_url = post.get('external_url')
+            site_name = post.get('site_name') if external_url else None
+            published = post.get('published')
 
-            # Footer with source and time (matches HTML)
             footer_parts = []
-            if post.get('external_url') and post.get('site_name'):
-                external_url = post['external_url']
-                site_name = post['site_name']
+            if site_name:
                 footer_parts.append(f"🔗 [{site_name}]({external_url})")
 
             # Add publication time if available
-            if post.get('published'):
-                time_str = format_timestamp_ago(post['published'])
+            if published:
+                time_str = format_timestamp_ago(published, now=now)
                 if time_str:
                     footer_parts.append(time_str)
 
-            if footer_parts:
-                md_parts.append(" • ".join(footer_parts))
-                md_parts.append("")
-            md_parts.append("---")
-            md_parts.append("")
+            footer_block = f"\n{' • '.join(footer_parts)}\n" if footer_parts else ""
+
+            md_parts.append(f"\n{title_line}\n{desc_block}{footer_block}\n---\n")
 
-        return '\n'.join(md_parts)
+        return ''.join(md_parts)
@@ -12,6 +12,7 @@ Quota usage:
 """
 import os
 import re
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
@@ -383,6 +384,9 @@ class YoutubeVideosWidget(BaseWidget):
             md_parts.append(f"## {title}: \"{query}\"")
         md_parts.append("")
 
+        # One clock read for every relative time in this render
+        now = time.time()
+
         for idx, video in enumerate(videos, 1):
             # Video title with link (matches HTML)
             title = video['title']
@@ -416,7 +420,7 @@ class YoutubeVideosWidget(BaseWidget):
 
             # Add publication time if available
             if video.get('published_at'):
-                time_str = format_timestamp_ago(video['published_at'])
+                time_str = format_timestamp_ago(video['published_at'], now=now)
                 if time_str:
                     stats_parts.append(time_str)
 